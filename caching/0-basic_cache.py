@@ -1,6 +1,6 @@
 #!/usr/bin/python3
-"""Import BaseCaching from base_caching"""
-from base_caching import BaseCaching
+"""Import PolicyCaching from policy_caching"""
+from policy_caching import PolicyCaching
 """
 Create a class BasicCache that inherits from
 BaseCaching and implements a caching system:
@@ -9,62 +9,19 @@ This caching system doesn't have a limit.
 """
 
 
-class BasicCache(BaseCaching):
+class BasicCache(PolicyCaching):
     """A basic caching system that uses a dictionary
     to store cached items.
 
     Inherits from BaseCaching and uses the `cache_data` dictionary
     to store cached items. It provides methods to add and retrieve
-    items from the cache."""
+    items from the cache, and never discards an item: items only
+    leave the cache when they expire. With a byte budget, a new
+    item that does not fit in what is left of it is discarded."""
 
-    def __init__(self):
+    def victim(self):
         """
-        Initialize the BasicCache instance.
-
-        Initializes the `cache_data` dictionary inherited from the parent class
-        to store the cached items.
-        """
-        self.cache_data = {}
-
-    def put(self, key, item):
-        """
-        Add an item to the cache.
-
-        Assigns the value `item` to the given
-        `key` in the `cache_data` dictionary.
-        If either `key` or `item` is `None`,
-        this method will not add the item
-        to the cache.
-
-        Args:
-            key (str): The key for the cache.
-            item (str): The item to store in the cache.
-
-        Returns:
-            None: This method does not return any value.
-        """
-        if key is not None and item is not None:
-            self.cache_data[key] = item
-
-    def get(self, key):
-        """
-        Retrieve an item from the cache.
-
-        Retrieves the value associated with
-        `key` from the `cache_data` dictionary.
-        If the `key` is `None` or does not exist
-        in the cache, returns `None`.
-
-        Args:
-            key (str): The key to retrieve from the cache.
-
-        Returns:
-            str or None: The cached item if found,
-            or `None` if the `key` is `None`
-            or not in the cache.
+        Return the key that the next put of a new key
+        would discard: always None, nothing is ever discarded.
         """
-        if key is None:
-            return None
-        if key not in self.cache_data:
-            return None
-        return self.cache_data[key]
+        return None
@@ -1,50 +1,36 @@
 #!/usr/bin/python3
 """inherits from BaseCaching and is a caching system:"""
+from collections import OrderedDict
 
-from base_caching import BaseCaching
+from policy_caching import PolicyCaching
 
 
-class FIFOCache(BaseCaching):
-    """Create a class LIFOCache that inherits
-    from BaseCaching and is a caching system:"""
+class FIFOCache(PolicyCaching):
+    """Create a class FIFOCache that inherits
+    from BaseCaching and is a caching system:
 
-    def __init__(self):
-        super().__init__()
+    If the number of items in self.cache_data
+     is higher that BaseCaching.MAX_ITEMS:
+    you must discard the first item put in cache (FIFO algorithm)
 
-        self.order = []
+    self.cache_data is an OrderedDict, whose insertion order is
+    the line: unlike a dict, it finds its first key in O(1)
+    however many keys were popped from the front.
+    """
 
-    def put(self, key, item):
+    def __init__(self, max_bytes=None, weigher=None):
+        super().__init__(max_bytes, weigher)
+
+        self.cache_data = OrderedDict()
+
+    def victim(self):
         """
-        def put(self, key, item):
-        Must assign to the dictionary self.cache_data
-        the item value for the key key.
-        If key or item is None,
-        this method should not do anything.
-        If the number of items in self.cache_data
-         is higher that BaseCaching.MAX_ITEMS:
-        you must discard the last item put in cache (LIFO algorithm)
-        you must print DISCARD: with the key discarded
-        and following by a new line
+        Return the key that the next put of a new key
+        would discard once the cache is full, or None
+        if the cache is empty.
         """
-        if key is None or item is None:
-            return
-
-        if key in self.cache_data:
-            self.order.remove(key)
-
-        self.cache_data[key] = item
-        self.order.append(key)
-
-        if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-            first_key = self.order.pop(0)
-            del self.cache_data[first_key]
-            print(f'DISCARD: {first_key}')
-
-    def get(self, key):
-        """Must return the value in
-         self.cache_data linked to key.
-        If key is None or if the key doesn’t
-        exist in self.cache_data, return None."""
-        if key is None or key not in self.cache_data:
-            return None
-        return self.cache_data[key]
+        return next(iter(self.cache_data), None)
+
+    def _update(self, key):
+        """A key put again goes back to the end of the line."""
+        self.cache_data.move_to_end(key)
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+"""
+Compare the hit ratio of LFUCache against LRUCache
+on Zipfian key traces.
+
+Usage: python3 100-lfu_benchmark.py [length] [keys]
+"""
+import itertools
+import random
+import sys
+from typing import List
+
+from base_caching import BaseCaching
+LFUCache = __import__('100-lfu_cache').LFUCache
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+def zipf_trace(length: int, keys: int, skew: float,
+               seed: int = 0) -> List[int]:
+    """
+    Return `length` keys drawn from `keys` distinct keys where
+    the i-th most popular key has a weight of 1 / i ** skew.
+    """
+    rng = random.Random(seed)
+    weights = itertools.accumulate(
+        1 / rank ** skew for rank in range(1, keys + 1))
+    return rng.choices(range(keys), cum_weights=list(weights), k=length)
+
+
+def hit_ratio(cache_class, trace: List[int], max_items: int) -> float:
+    """
+    Replay `trace` through a new `cache_class` holding `max_items`
+    items and return the fraction of get calls that hit.
+    """
+    saved_max_items = BaseCaching.MAX_ITEMS
+    BaseCaching.MAX_ITEMS = max_items
+    try:
+        cache = cache_class()
+        cache.listeners = []
+        for key in trace:
+            if cache.get(key) is None:
+                cache.put(key, key)
+    finally:
+        BaseCaching.MAX_ITEMS = saved_max_items
+    return cache.stats()['hit_ratio']
+
+
+if __name__ == "__main__":
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    print(f"{'skew':>5} {'max_items':>9} {'LRU':>7} {'LFU':>7}")
+    for skew in (0.8, 1.0, 1.2):
+        trace = zipf_trace(length, keys, skew)
+        for max_items in (keys // 100, keys // 20, keys // 10):
+            lru = hit_ratio(LRUCache, trace, max_items)
+            lfu = hit_ratio(LFUCache, trace, max_items)
+            print(f"{skew:>5} {max_items:>9} {lru:>7.2%} {lfu:>7.2%}")
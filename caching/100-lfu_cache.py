@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+from order_list import OrderList
+from policy_caching import PolicyCaching
+
+
+class LFUCache(PolicyCaching):
+    """
+    Create a class LFUCache that inherits
+    from BaseCaching and is a caching system:
+
+    If the number of items in self.cache_data is
+      higher that BaseCaching.MAX_ITEMS:
+    you must discard the least frequency used item (LFU algorithm)
+    if you find more than 1 item to discard, you must use
+      the LRU algorithm to discard only the least recently used
+
+    Keys are grouped in frequency buckets, each an OrderList
+    kept in least recently used order, so that finding and
+    discarding the least frequently used item is O(1).
+
+    When the bucket of the lowest frequency empties, min_freq
+    becomes None rather than being looked for among every
+    bucket: the insert following an eviction sets it back to 1,
+    and victim() only looks for it when nothing did.
+    """
+
+    def __init__(self, max_bytes=None, weigher=None):
+        super().__init__(max_bytes, weigher)
+
+        self.freq = {}
+        self.buckets = {}
+        self.min_freq = 0
+
+    def victim(self):
+        """
+        Return the key that the next put of a new key
+        would discard once the cache is full, or None
+        if the cache is empty.
+        """
+        if self.min_freq is None:
+            self.min_freq = min(self.buckets, default=0)
+        bucket = self.buckets.get(self.min_freq)
+        return bucket.first() if bucket else None
+
+    def _ordered_keys(self):
+        """Return the keys from the least frequently used, each
+        bucket from the least recently used."""
+        return [key for count in sorted(self.buckets)
+                for key in self.buckets[count]]
+
+    def _key_state(self, key):
+        """The frequency of key is saved in snapshots."""
+        return self.freq[key]
+
+    def _restore_key(self, key, state):
+        """A restored key gets back its frequency."""
+        self.freq[key] = state
+        self.buckets.setdefault(state, OrderList()).append(key)
+        if self.min_freq is not None:
+            self.min_freq = min(self.min_freq or state, state)
+
+    def _insert(self, key):
+        """A new key has been used once."""
+        self.freq[key] = 1
+        self.buckets.setdefault(1, OrderList()).append(key)
+        self.min_freq = 1
+
+    def _access(self, key):
+        """Move key from its frequency bucket to the next one."""
+        count = self.freq[key]
+        bucket = self.buckets[count]
+        bucket.remove(key)
+        if not bucket:
+            del self.buckets[count]
+            if self.min_freq == count:
+                self.min_freq = count + 1
+
+        self.freq[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderList()).append(key)
+
+    def _remove(self, key):
+        """Forget the frequency of key."""
+        count = self.freq.pop(key)
+        bucket = self.buckets[count]
+        bucket.remove(key)
+        if not bucket:
+            del self.buckets[count]
+            if self.min_freq == count:
+                self.min_freq = None
@@ -0,0 +1,193 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+from order_list import OrderList
+from policy_caching import PolicyCaching
+
+
+class ARCCache(PolicyCaching):
+    """
+    Create a class ARCCache that inherits
+    from BaseCaching and is a caching system:
+
+    Adaptive Replacement Cache. Cached keys live in two
+    lists, t1 (seen once recently) and t2 (seen at least
+    twice), each in least recently used order. Keys
+    discarded from them are remembered, without their
+    item, in the ghost lists b1 and b2. A put that hits a
+    ghost list moves the target size `p` of t1 towards
+    recency (b1) or frequency (b2).
+
+    _store() is overridden because the discarded item depends on
+    which ghost list, if any, holds the new key. The ghost lists
+    are sized in items, so BaseCaching.MAX_ITEMS still bounds
+    the cache when it also has a byte budget.
+    """
+
+    def __init__(self, max_bytes=None, weigher=None):
+        super().__init__(max_bytes, weigher)
+
+        self.t1 = OrderList()
+        self.t2 = OrderList()
+        self.b1 = OrderList()
+        self.b2 = OrderList()
+        self.__p = 0
+
+    @property
+    def p(self):
+        """Target number of items for the recency list t1."""
+        return self.__p
+
+    def _store(self, key, item, ttl):
+        """
+        Must assign to the dictionary self.cache_data the
+        item value for the key key.
+        If the number of items in self.cache_data is
+          higher that BaseCaching.MAX_ITEMS:
+        you must discard an item chosen by the ARC algorithm
+        you must report the key discarded to the listeners,
+          which by default print DISCARD: with it
+        If ttl is given, the item expires ttl seconds later,
+          otherwise it never expires.
+        """
+        weight = self._weigh(item)
+        if self.max_bytes is not None and weight > self.max_bytes:
+            self._refuse(key, item)
+            return
+
+        if key in self.cache_data:
+            self.cache_data[key] = item
+            self._set_weight(key, weight)
+            self._update(key)
+            self._shrink()
+            self.__trim_ghosts()
+            if key in self.cache_data:
+                self._set_ttl(key, ttl)
+            return
+
+        max_items = self.MAX_ITEMS
+        if key in self.b1:
+            step = max(len(self.b2) // len(self.b1), 1)
+            self.__p = min(self.__p + step, max_items)
+            self.__replace(key, weight)
+            self.b1.remove(key)
+            target = self.t2
+        elif key in self.b2:
+            step = max(len(self.b1) // len(self.b2), 1)
+            self.__p = max(self.__p - step, 0)
+            self.__replace(key, weight)
+            self.b2.remove(key)
+            target = self.t2
+        else:
+            if len(self.t1) + len(self.b1) >= max_items:
+                if len(self.t1) < max_items:
+                    self.b1.popleft()
+                    self.__replace(key, weight)
+                else:
+                    self._discard(self.t1.popleft())
+            else:
+                total = (len(self.t1) + len(self.t2) +
+                         len(self.b1) + len(self.b2))
+                if total >= 2 * max_items:
+                    self.b2.popleft()
+                self.__replace(key, weight)
+            target = self.t1
+
+        self._make_room(weight)
+        target.append(key)
+        self.__trim_ghosts()
+        self.cache_data[key] = item
+        self._set_weight(key, weight)
+        self._set_ttl(key, ttl)
+        self.insertions += 1
+
+    def victim(self):
+        """
+        Return the key that the next put of a new key,
+        absent from the ghost lists, would discard once
+        the cache is full, or None if the cache is empty.
+        """
+        if self.t1 and (len(self.t1) > self.__p or not self.t2):
+            return self.t1.first()
+        return self.t2.first()
+
+    def _full(self, weight=0):
+        """Whether a new item of `weight` needs a discard to fit,
+        either in BaseCaching.MAX_ITEMS or in the byte budget."""
+        return (len(self.cache_data) >= self.MAX_ITEMS or
+                super()._full(weight))
+
+    def _ordered_keys(self):
+        """Return the keys of t1 then of t2, each from the least
+        recently used."""
+        return list(self.t1) + list(self.t2)
+
+    def _key_state(self, key):
+        """Whether key was seen once (1) or more (2) is saved
+        in snapshots."""
+        return 2 if key in self.t2 else 1
+
+    def _policy_state(self):
+        """The target size p and the ghost lists are saved
+        in snapshots."""
+        return self.__p, list(self.b1), list(self.b2)
+
+    def _restore_policy_state(self, state):
+        """Restore p and the ghosts of keys not cached since."""
+        self.__p, b1, b2 = state
+        for ghosts, keys in ((self.b1, b1), (self.b2, b2)):
+            for key in keys:
+                if key not in self.cache_data and key not in self.b1 \
+                        and key not in self.b2:
+                    ghosts.append(key)
+        self.__trim_ghosts()
+
+    def _restore_key(self, key, state):
+        """A restored key goes back to its list."""
+        (self.t2 if state == 2 else self.t1).append(key)
+        self.__trim_ghosts()
+
+    def _access(self, key):
+        """Make a cached key the most recent key of t2."""
+        if key in self.t1:
+            self.t1.remove(key)
+        self.t2.append(key)
+
+    def _remove(self, key):
+        """Forget key without remembering it as a ghost."""
+        self.t1.discard(key)
+        self.t2.discard(key)
+
+    def _evict(self, key=None):
+        """
+        Move the key to discard to make room for `key` from
+        its list to the matching ghost list and return it.
+        """
+        t1_size = len(self.t1)
+        if t1_size and (t1_size > self.__p or not self.t2 or
+                        (key in self.b2 and t1_size == self.__p)):
+            old_key = self.t1.popleft()
+            self.b1.append(old_key)
+        else:
+            old_key = self.t2.popleft()
+            self.b2.append(old_key)
+        return old_key
+
+    def __replace(self, key, weight):
+        """
+        Discard one cached item to make room for `key` and
+        its `weight` if the cache is full.
+        """
+        if self._full(weight):
+            self._discard(self._evict(key))
+
+    def __trim_ghosts(self):
+        """
+        Forget the oldest ghosts once extra discards for the
+        byte budget made the ghost lists outgrow their bounds.
+        """
+        max_items = self.MAX_ITEMS
+        while self.b1 and len(self.t1) + len(self.b1) > max_items:
+            self.b1.popleft()
+        while self.b2 and (len(self.t1) + len(self.t2) + len(self.b1) +
+                           len(self.b2)) > 2 * max_items:
+            self.b2.popleft()
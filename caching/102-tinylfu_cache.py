@@ -0,0 +1,176 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+from base_caching import BaseCaching
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class CountMinSketch:
+    """
+    Approximate access counts in `depth` rows of `width`
+    byte counters.
+
+    Counters saturate at 15 and are all halved every
+    `reset_interval` additions, so that old popularity
+    fades away instead of pinning keys forever.
+    """
+
+    MAX_COUNT = 15
+    HALVE = bytes(count >> 1 for count in range(256))
+
+    def __init__(self, width, depth=4, reset_interval=None):
+        """
+        Create a sketch of `depth` rows of `width` counters.
+
+        Args:
+            width (int): The number of counters per row.
+            depth (int): The number of rows, one hash per row.
+            reset_interval (int): The number of additions between
+              two agings, 10 * width by default.
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self.reset_interval = reset_interval or 10 * width
+        self.rows = [bytearray(width) for _ in range(depth)]
+        self.additions = 0
+
+    def add(self, key):
+        """Count one more access to `key`."""
+        width = self.width
+        for seed, row in enumerate(self.rows):
+            index = hash((seed, key)) % width
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+
+        self.additions += 1
+        if self.additions >= self.reset_interval:
+            self.age()
+
+    def estimate(self, key):
+        """Return the estimated number of accesses to `key`."""
+        width = self.width
+        return min(row[hash((seed, key)) % width]
+                   for seed, row in enumerate(self.rows))
+
+    def age(self):
+        """Halve every counter."""
+        self.rows = [row.translate(self.HALVE) for row in self.rows]
+        self.additions //= 2
+
+
+class TinyLFUCache(BaseCaching):
+    """
+    Create a class TinyLFUCache that inherits
+    from BaseCaching and is a caching system:
+
+    A TinyLFU admission filter in front of another policy.
+    When the cache is full, a new key is only stored if the
+    sketch says it was accessed more often than the key the
+    wrapped policy would discard for it.
+    """
+
+    def __init__(self, policy=LRUCache, width=None, reset_interval=None):
+        """
+        Wrap a new instance of `policy`.
+
+        Args:
+            policy (type): The BaseCaching class doing the eviction,
+              it must provide victim().
+            width (int): The number of counters per sketch row,
+              8 * BaseCaching.MAX_ITEMS by default.
+            reset_interval (int): The number of accesses between two
+              agings of the sketch, 10 * width by default.
+        """
+        super().__init__()
+
+        self.cache = policy()
+        self.cache_data = self.cache.cache_data
+        self.sketch = CountMinSketch(
+            width or max(8 * BaseCaching.MAX_ITEMS, 16),
+            reset_interval=reset_interval)
+
+    def put(self, key, item, ttl=None):
+        """
+        Must assign to the dictionary self.cache_data the
+        item value for the key key.
+        If key or item is None, this method should not do anything.
+        If the wrapped policy has no room left for item:
+        it discards its victim only if key is
+          estimated to be used more often than it, otherwise
+          key itself is discarded
+        the wrapped policy reports the key discarded to its
+          listeners, by default printing DISCARD: with it
+        If ttl is given, the item expires ttl seconds later.
+        """
+        if key is None or item is None:
+            return
+
+        if self.__admit(key, item):
+            self.cache.put(key, item, ttl)
+
+    def get(self, key):
+        """
+        Must return the value in self.cache_data linked to key.
+        If key is None or if the key doesn’t
+        exist in self.cache_data, return None.
+        """
+        if key is None:
+            return None
+
+        self.sketch.add(key)
+
+        return self.cache.get(key)
+
+    def put_many(self, items, ttl=None):
+        """
+        Put every key and item of `items`, a dictionary or an
+        iterable of (key, item) pairs, in order, each going
+        through the sketch and the admission check as with put(),
+        while the wrapped policy reclaims expired items once for
+        the whole batch.
+        """
+        if isinstance(items, dict):
+            items = items.items()
+
+        self.cache._reclaim()
+
+        for key, item in items:
+            if key is not None and item is not None and \
+                    self.__admit(key, item):
+                self.cache._store(key, item, ttl)
+
+    def get_many(self, keys):
+        """
+        Return a dictionary of the items found for `keys`, each
+        counted in the sketch as with get(), skipping None keys.
+        """
+        self.cache._reclaim()
+
+        found = {}
+        for key in keys:
+            if key is not None:
+                self.sketch.add(key)
+                item = self.cache._lookup(key)
+                if item is not None:
+                    found[key] = item
+        return found
+
+    def stats(self):
+        """Return the statistics of the wrapped policy."""
+        return self.cache.stats()
+
+    def __admit(self, key, item):
+        """Count a put of `key` in the sketch and return whether
+        `item` is let in, refusing it otherwise."""
+        self.sketch.add(key)
+
+        if (key not in self.cache_data and
+                self.cache._full(self.cache._weigh(item))):
+            victim = self.cache.victim()
+            if (victim is not None and
+                    self.sketch.estimate(key) <=
+                    self.sketch.estimate(victim)):
+                self.cache._refuse(key, item)
+                return False
+        return True
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+import threading
+
+from base_caching import BaseCaching
+from policy_caching import merge_stats
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class ShardedCache(BaseCaching):
+    """
+    Create a class ShardedCache that inherits
+    from BaseCaching and is a caching system:
+
+    Keys are spread by hash over `shards` independent
+    instances of a policy, each guarded by its own lock,
+    so threads working on different shards never wait for
+    each other. Every shard evicts on its own and holds up
+    to BaseCaching.MAX_ITEMS items.
+    """
+
+    def __init__(self, policy=LRUCache, shards=8):
+        """
+        Create `shards` instances of `policy`.
+
+        Args:
+            policy (type): The BaseCaching class of every shard.
+            shards (int): The number of shards.
+        """
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        self.shards = [policy() for _ in range(shards)]
+        self.locks = [threading.Lock() for _ in range(shards)]
+
+    @property
+    def cache_data(self):
+        """A snapshot of the items of every shard."""
+        cache_data = {}
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                cache_data.update(shard.cache_data)
+        return cache_data
+
+    def put(self, key, item, ttl=None):
+        """
+        Must assign the item value for the key key
+        in the shard of key.
+        If key or item is None, this method should not do anything.
+        If the number of items in that shard is
+          higher that BaseCaching.MAX_ITEMS:
+        the shard discards an item with its own policy
+        If ttl is given, the item expires ttl seconds later.
+        """
+        if key is None or item is None:
+            return
+
+        index = hash(key) % len(self.shards)
+        with self.locks[index]:
+            self.shards[index].put(key, item, ttl)
+
+    def get(self, key):
+        """
+        Must return the value linked to key in the shard of key.
+        If key is None or if the key doesn’t
+        exist in the cache, return None.
+        """
+        if key is None:
+            return None
+
+        index = hash(key) % len(self.shards)
+        with self.locks[index]:
+            return self.shards[index].get(key)
+
+    def put_many(self, items, ttl=None):
+        """
+        Put every key and item of `items`, a dictionary or an
+        iterable of (key, item) pairs, taking the lock of each
+        shard once. Pairs keep their order within a shard.
+        """
+        if isinstance(items, dict):
+            items = items.items()
+
+        batches = [[] for _ in self.shards]
+        for key, item in items:
+            if key is not None and item is not None:
+                batches[hash(key) % len(self.shards)].append((key, item))
+
+        for shard, lock, batch in zip(self.shards, self.locks, batches):
+            if batch:
+                with lock:
+                    shard.put_many(batch, ttl)
+
+    def get_many(self, keys):
+        """
+        Return a dictionary of the items found for `keys`,
+        taking the lock of each shard once.
+        """
+        batches = [[] for _ in self.shards]
+        for key in keys:
+            if key is not None:
+                batches[hash(key) % len(self.shards)].append(key)
+
+        found = {}
+        for shard, lock, batch in zip(self.shards, self.locks, batches):
+            if batch:
+                with lock:
+                    found.update(shard.get_many(batch))
+        return found
+
+    def stats(self):
+        """Return the statistics of all the shards added up."""
+        all_stats = []
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                all_stats.append(shard.stats())
+        return merge_stats(all_stats)
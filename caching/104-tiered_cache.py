@@ -0,0 +1,283 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+import pickle
+import sqlite3
+import time
+
+from base_caching import BaseCaching
+from policy_caching import DISCARD, EXPIRED, print_removal
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class TieredCache(BaseCaching):
+    """
+    Create a class TieredCache that inherits
+    from BaseCaching and is a caching system:
+
+    An in-memory policy (L1) in front of an SQLite file (L2).
+    Items discarded by L1 are spilled to L2 instead of being
+    lost, and a get that misses L1 but finds the key in L2
+    moves the item back to L1. Items that expire in L1 are
+    reported to `listeners` and never spilled.
+
+    Expired rows of L2 are purged every PURGE_INTERVAL seconds
+    and reported as EXPIRED. Given max_rows or max_bytes, L2
+    drops its oldest spilled rows once it holds more, reporting
+    them as DISCARD. Rows are counted with DELETE ... RETURNING,
+    which needs SQLite 3.35 or later.
+    """
+
+    DB_FILE = "l2_cache.db"
+    PURGE_INTERVAL = 60.0
+    SELECT_BATCH = 500
+
+    def __init__(self, policy=LRUCache, path=None, max_rows=None,
+                 max_bytes=None):
+        """
+        Create the L1 and open, or create, the L2 file.
+
+        Args:
+            policy (type): The BaseCaching class of the L1.
+            path (str): The SQLite file of the L2, DB_FILE by default.
+            max_rows (int): The most rows L2 keeps, or None.
+            max_bytes (int): The most bytes of pickled items L2
+              keeps, or None.
+        """
+        self.cache = policy()
+        self.cache.listeners = [self.__on_removal]
+        self.listeners = [print_removal]
+        self.deadlines = {}
+        self.spills = 0
+        self.l2_hits = 0
+        self.l2_evictions = 0
+        self.l2_expirations = 0
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.purged = time.monotonic()
+
+        self.db = sqlite3.connect(path or self.DB_FILE,
+                                  isolation_level=None,
+                                  check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=OFF")
+        self.db.execute("CREATE TABLE IF NOT EXISTS entries ("
+                        "key BLOB PRIMARY KEY, item BLOB NOT NULL, "
+                        "deadline REAL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_deadline "
+                        "ON entries (deadline)")
+        self.rows, self.bytes = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(item)), 0) "
+            "FROM entries").fetchone()
+
+    @property
+    def cache_data(self):
+        """The items held in memory by the L1."""
+        return self.cache.cache_data
+
+    def put(self, key, item, ttl=None):
+        """
+        Must assign the item value for the key key in the L1.
+        If key or item is None, this method should not do anything.
+        If the L1 is full, the item it discards is spilled to L2.
+        If ttl is given, the item expires ttl seconds later,
+          in either tier.
+        """
+        if key is None or item is None:
+            return
+
+        self.__maybe_purge()
+        self.__put(key, item, ttl)
+
+    def get(self, key):
+        """
+        Must return the value linked to key, from the L1 or
+        else from the L2, in which case it moves back to the L1.
+        If key is None or if the key doesn’t
+        exist in either tier, or has expired, return None.
+        """
+        if key is None:
+            return None
+
+        self.__maybe_purge()
+        item = self.cache.get(key)
+        if item is not None:
+            return item
+
+        blob = pickle.dumps(key)
+        row = self.db.execute(
+            "SELECT item, deadline FROM entries WHERE key = ?",
+            (blob,)).fetchone()
+        if row is None:
+            return None
+        return self.__promote(key, blob, *row)
+
+    def put_many(self, items, ttl=None):
+        """
+        Put every key and item of `items`, a dictionary or an
+        iterable of (key, item) pairs, in order, as put() would,
+        in a single L2 transaction. Pairs with a None key or item
+        are skipped.
+        """
+        if isinstance(items, dict):
+            items = items.items()
+
+        self.__maybe_purge()
+        self.db.execute("BEGIN")
+        try:
+            for key, item in items:
+                if key is not None and item is not None:
+                    self.__put(key, item, ttl)
+        finally:
+            self.db.execute("COMMIT")
+
+    def get_many(self, keys):
+        """
+        Return a dictionary of the items found for `keys`, looked
+        up in order as get() would, skipping None keys.
+
+        The L2 rows of the keys missing from the L1 are read with
+        one SELECT per SELECT_BATCH keys up front, and the items
+        found there move back to the L1 in a single transaction.
+        """
+        keys = [key for key in keys if key is not None]
+        self.__maybe_purge()
+
+        blobs = list({pickle.dumps(key): None for key in keys
+                      if key not in self.cache.cache_data})
+        rows = {}
+        for start in range(0, len(blobs), self.SELECT_BATCH):
+            batch = blobs[start:start + self.SELECT_BATCH]
+            rows.update((blob, (item, deadline))
+                        for blob, item, deadline in self.db.execute(
+                            "SELECT key, item, deadline FROM entries "
+                            "WHERE key IN ({})".format(
+                                ", ".join("?" * len(batch))),
+                            batch))
+
+        found = {}
+        self.db.execute("BEGIN")
+        try:
+            for key in keys:
+                item = self.cache.get(key)
+                if item is None:
+                    # A key spilled during the batch was not read up
+                    # front, and a row read up front is used once.
+                    blob = pickle.dumps(key)
+                    row = rows.pop(blob, None) or self.db.execute(
+                        "SELECT item, deadline FROM entries "
+                        "WHERE key = ?", (blob,)).fetchone()
+                    if row is not None:
+                        item = self.__promote(key, blob, *row)
+                if item is not None:
+                    found[key] = item
+        finally:
+            self.db.execute("COMMIT")
+        return found
+
+    def stats(self):
+        """Return the statistics of the L1 with the number of
+        spills to L2, of hits in L2, of rows dropped by its caps
+        or purged once expired, and its number of rows."""
+        stats = self.cache.stats()
+        stats['spills'] = self.spills
+        stats['l2_hits'] = self.l2_hits
+        stats['l2_evictions'] = self.l2_evictions
+        stats['l2_expirations'] = self.l2_expirations
+        stats['l2_rows'] = self.rows
+        return stats
+
+    def purge(self):
+        """Delete the expired rows of L2 and report them."""
+        self.purged = time.monotonic()
+        rows = self.db.execute(
+            "DELETE FROM entries WHERE deadline <= ? "
+            "RETURNING key, item", (time.time(),)).fetchall()
+        for key, item in rows:
+            self.rows -= 1
+            self.bytes -= len(item)
+            self.l2_expirations += 1
+            self.__notify(pickle.loads(key), pickle.loads(item), EXPIRED)
+
+    def close(self):
+        """Close the L2 file."""
+        self.db.close()
+
+    def __on_removal(self, key, item, cause):
+        """Spill the items discarded by the L1 and report the
+        expired ones."""
+        deadline = self.deadlines.pop(key, None)
+        if cause == DISCARD:
+            self.spills += 1
+            blob, data = pickle.dumps(key), pickle.dumps(item)
+            self.__delete(blob)
+            self.db.execute("INSERT INTO entries VALUES (?, ?, ?)",
+                            (blob, data, deadline))
+            self.rows += 1
+            self.bytes += len(data)
+            self.__bound()
+        elif cause == EXPIRED:
+            self.__notify(key, item, cause)
+
+    def __put(self, key, item, ttl):
+        """Put `item` in the L1, dropping its copy in the L2."""
+        if ttl is None:
+            self.deadlines.pop(key, None)
+        else:
+            self.deadlines[key] = time.time() + ttl
+        self.__delete(pickle.dumps(key))
+        self.cache.put(key, item, ttl)
+
+    def __promote(self, key, blob, data, deadline):
+        """Move the L2 row of `key` back to the L1 and return its
+        item, or None if it expired or left the L2 meanwhile."""
+        if not self.__delete(blob):
+            return None
+        item = pickle.loads(data)
+        ttl = None
+        if deadline is not None:
+            ttl = deadline - time.time()
+            if ttl <= 0:
+                return None
+            self.deadlines[key] = deadline
+
+        self.l2_hits += 1
+        self.cache.put(key, item, ttl)
+        return item
+
+    def __notify(self, key, item, cause):
+        """Report the removal of `key` to every listener."""
+        for listener in self.listeners:
+            listener(key, item, cause)
+
+    def __delete(self, blob):
+        """Remove the L2 copy of a pickled key, if any, and
+        return whether there was one."""
+        sizes = self.db.execute(
+            "DELETE FROM entries WHERE key = ? "
+            "RETURNING LENGTH(item)", (blob,)).fetchall()
+        for size, in sizes:
+            self.rows -= 1
+            self.bytes -= size
+        return bool(sizes)
+
+    def __bound(self):
+        """Drop the oldest spilled rows of L2 until it fits its
+        caps, and report them."""
+        while self.rows and (
+                (self.max_rows is not None and
+                 self.rows > self.max_rows) or
+                (self.max_bytes is not None and
+                 self.bytes > self.max_bytes)):
+            key, item = self.db.execute(
+                "DELETE FROM entries WHERE rowid = "
+                "(SELECT MIN(rowid) FROM entries) "
+                "RETURNING key, item").fetchone()
+            self.rows -= 1
+            self.bytes -= len(item)
+            self.l2_evictions += 1
+            self.__notify(pickle.loads(key), pickle.loads(item), DISCARD)
+
+    def __maybe_purge(self):
+        """purge() once every PURGE_INTERVAL seconds."""
+        if time.monotonic() - self.purged >= self.PURGE_INTERVAL:
+            self.purge()
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""
+A memoization decorator backed by the caching policies,
+with single-flight loading.
+"""
+import functools
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+KWARGS_MARK = object()
+
+
+def make_key(args: tuple, kwargs: dict) -> tuple:
+    """
+    Return a hashable key for a call with the positional
+    arguments `args` and the keyword arguments `kwargs`,
+    whatever the order of the keyword arguments.
+    """
+    if not kwargs:
+        return args
+    return args + (KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def cached(policy: type = LRUCache, max_items: Optional[int] = None,
+           ttl: Optional[float] = None) -> Callable:
+    """
+    Decorator memoizing a function in an instance of `policy`.
+
+    Results are stored under a key made of the arguments of the
+    call, which must be hashable. When several threads miss the
+    same key at once, only the first one calls the function:
+    the others wait for its result, or its exception. None
+    results are cached like any other.
+
+    Args:
+        policy (type): The BaseCaching class storing the results.
+        max_items (int): The number of results to keep,
+          BaseCaching.MAX_ITEMS by default.
+        ttl (float): The number of seconds a result stays valid,
+          forever by default.
+
+    The cache and the function are available as the `cache`
+    and `__wrapped__` attributes of the decorated function.
+    """
+    def decorator(function: Callable) -> Callable:
+        """Memoize `function`."""
+        cache = policy()
+        cache.listeners = []
+        if max_items is not None:
+            cache.MAX_ITEMS = max_items
+        lock = threading.Lock()
+        loading = {}
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            """Return the cached result of the call, computing it
+            at most once at a time per key."""
+            key = make_key(args, kwargs)
+            with lock:
+                box = cache.get(key)
+                if box is not None:
+                    return box[0]
+                future = loading.get(key)
+                leader = future is None
+                if leader:
+                    future = loading[key] = Future()
+
+            if not leader:
+                return future.result()
+
+            try:
+                result = function(*args, **kwargs)
+            except BaseException as error:
+                with lock:
+                    del loading[key]
+                future.set_exception(error)
+                raise
+
+            with lock:
+                cache.put(key, (result,), ttl)
+                del loading[key]
+            future.set_result(result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
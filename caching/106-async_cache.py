@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""
+An asyncio facade over the caching policies, coalescing
+concurrent loads of the same missing key.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class AsyncCache:
+    """
+    Async get, put and get-or-load around an instance of a
+    policy, for use from a single event loop.
+
+    While a key is being loaded, every aget_or_load of that
+    key awaits the same task instead of calling the loader
+    again.
+    """
+
+    def __init__(self, policy: type = LRUCache):
+        """
+        Create an instance of `policy`.
+
+        Args:
+            policy (type): The BaseCaching class storing the items.
+        """
+        self.cache = policy()
+        self.loading = {}
+
+    async def aget(self, key: Hashable) -> Any:
+        """Return the item of `key`, or None if it is not cached."""
+        return self.cache.get(key)
+
+    async def aput(self, key: Hashable, item: Any,
+                   ttl: Optional[float] = None) -> None:
+        """Cache `item` for `key`, for `ttl` seconds if given."""
+        self.cache.put(key, item, ttl)
+
+    async def aget_or_load(self, key: Hashable,
+                           loader: Callable[[Hashable], Awaitable],
+                           ttl: Optional[float] = None) -> Any:
+        """
+        Return the item of `key`, awaiting `loader(key)` and
+        caching its result, for `ttl` seconds if given, when
+        the key is not cached.
+
+        Concurrent calls for the same key share one load, and
+        its exception if it fails. Cancelling one caller does
+        not cancel the load for the others.
+        """
+        item = self.cache.get(key)
+        if item is not None:
+            return item
+
+        task = self.loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.__load(key, loader, ttl))
+            self.loading[key] = task
+        return await asyncio.shield(task)
+
+    async def __load(self, key: Hashable,
+                     loader: Callable[[Hashable], Awaitable],
+                     ttl: Optional[float]) -> Any:
+        """Await `loader(key)` and cache its result."""
+        try:
+            item = await loader(key)
+            self.cache.put(key, item, ttl)
+            return item
+        finally:
+            del self.loading[key]
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+"""
+Replay key traces through the caching policies and report,
+for every policy and capacity, the hit ratio, the number of
+operations per second and the peak memory.
+
+Usage: python3 107-trace_benchmark.py [-h] [--trace TRACE]
+           [--length LENGTH] [--keys KEYS] [--skew SKEW]
+           [--sizes SIZES] [--policies POLICIES]
+
+TRACE is zipf, scan or loop for a synthetic trace, or the
+path of a file holding one key per line.
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Dict, List
+
+zipf_trace = __import__('100-lfu_benchmark').zipf_trace
+
+POLICIES = {
+    'basic': __import__('0-basic_cache').BasicCache,
+    'fifo': __import__('1-fifo_cache').FIFOCache,
+    'lifo': __import__('2-lifo_cache').LIFOCache,
+    'lru': __import__('3-lru_cache').LRUCache,
+    'mru': __import__('4-mru_cache').MRUCache,
+    'lfu': __import__('100-lfu_cache').LFUCache,
+    'arc': __import__('101-arc_cache').ARCCache,
+    'tinylfu': __import__('102-tinylfu_cache').TinyLFUCache,
+    'clock': __import__('110-clock_cache').ClockCache,
+    'gdsf': __import__('111-gdsf_cache').GDSFCache,
+}
+
+
+def scan_trace(length: int, keys: int) -> List[int]:
+    """
+    Return `length` keys where a hot set of `keys` keys is
+    read in turn, interrupted every `keys` reads by a scan of
+    `keys` keys that are never read again.
+    """
+    trace = []
+    next_cold = keys
+    while len(trace) < length:
+        trace.extend(range(keys))
+        trace.extend(range(next_cold, next_cold + keys))
+        next_cold += keys
+    return trace[:length]
+
+
+def loop_trace(length: int, keys: int) -> List[int]:
+    """Return `length` keys cycling over `keys` keys in order."""
+    return [index % keys for index in range(length)]
+
+
+def file_trace(path: str) -> List[str]:
+    """Return the keys of a file holding one key per line."""
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def make_cache(name: str, max_items: int):
+    """Return a silent cache of the policy `name` holding
+    `max_items` items."""
+    if name == 'tinylfu':
+        cache = POLICIES[name](width=max(8 * max_items, 16))
+        policy = cache.cache
+    else:
+        cache = policy = POLICIES[name]()
+    policy.listeners = []
+    policy.MAX_ITEMS = max_items
+    return cache
+
+
+def replay(cache, trace: List) -> int:
+    """Read every key of `trace`, putting it on a miss, and
+    return the number of hits."""
+    hits = 0
+    for key in trace:
+        if cache.get(key) is None:
+            cache.put(key, key)
+        else:
+            hits += 1
+    return hits
+
+
+def measure(name: str, trace: List, max_items: int) -> Dict:
+    """
+    Replay `trace` through the policy `name` holding `max_items` items
+    and return its hit ratio, operations per second and peak
+    memory in bytes.
+
+    The memory is traced in a second replay, so that tracing
+    does not slow down the timed one.
+    """
+    cache = make_cache(name, max_items)
+    start = time.perf_counter()
+    hits = replay(cache, trace)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        replay(make_cache(name, max_items), trace)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'hit_ratio': hits / len(trace),
+        'ops_per_sec': len(trace) / elapsed if elapsed else 0.0,
+        'peak_bytes': peak,
+    }
+
+
+def main():
+    """Parse the arguments and print one line per policy and size."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--trace', default='zipf')
+    parser.add_argument('--length', type=int, default=100000)
+    parser.add_argument('--keys', type=int, default=10000)
+    parser.add_argument('--skew', type=float, default=1.0)
+    parser.add_argument('--sizes', default='100,500,1000')
+    parser.add_argument('--policies', default=','.join(POLICIES))
+    args = parser.parse_args()
+
+    if args.trace == 'zipf':
+        trace = zipf_trace(args.length, args.keys, args.skew)
+    elif args.trace == 'scan':
+        trace = scan_trace(args.length, args.keys)
+    elif args.trace == 'loop':
+        trace = loop_trace(args.length, args.keys)
+    else:
+        trace = file_trace(args.trace)
+
+    print(f"{'policy':<8} {'max_items':>9} {'hit_ratio':>9} "
+          f"{'ops/sec':>10} {'peak_kib':>9}")
+    for name in args.policies.split(','):
+        for max_items in map(int, args.sizes.split(',')):
+            result = measure(name, trace, max_items)
+            print(f"{name:<8} {max_items:>9} {result['hit_ratio']:>9.2%} "
+                  f"{result['ops_per_sec']:>10.0f} "
+                  f"{result['peak_bytes'] / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+"""
+Estimate the miss-ratio curve of LRUCache in one pass over a
+key trace, with the spatially hashed sampling of SHARDS.
+
+Usage: python3 108-shards_mrc.py [-h] [--rate RATE]
+           [--sizes SIZES] [--points POINTS] [--format {csv,json}]
+           [--check] [TRACE]
+
+TRACE is a file holding one key per line, standard input by
+default, so that a live trace can be piped in. --check also
+replays the trace through a real LRUCache of every size, to
+check the estimate against.
+"""
+import argparse
+import json
+import sys
+import zlib
+from typing import Dict, Hashable, Iterable, List, Optional
+
+MODULUS = 1 << 24
+
+
+class Fenwick:
+    """
+    A binary indexed tree over a growing array of 0 and 1,
+    counting the ones before an index in O(log n).
+    """
+
+    def __init__(self, ones: int = 0):
+        """Create an array of `ones` ones."""
+        self.tree = [index & -index for index in range(ones + 1)]
+
+    def __len__(self) -> int:
+        """Return the length of the array."""
+        return len(self.tree) - 1
+
+    def append(self, value: int) -> None:
+        """Add `value` at the end of the array."""
+        index = len(self.tree)
+        self.tree.append(value + self.prefix(index - 1)
+                         - self.prefix(index - (index & -index)))
+
+    def add(self, index: int, value: int) -> None:
+        """Add `value` to the element at `index`, from 0."""
+        index += 1
+        while index < len(self.tree):
+            self.tree[index] += value
+            index += index & -index
+
+    def prefix(self, end: int) -> int:
+        """Return the sum of the elements before `end`."""
+        total = 0
+        while end > 0:
+            total += self.tree[end]
+            end -= end & -end
+        return total
+
+
+class ShardsMRC:
+    """
+    Track the LRU reuse distance of a sample of the keys of a
+    trace and turn their histogram into a miss-ratio curve.
+
+    A key is sampled when a hash of it falls under `rate`, so
+    either every reference to a key is seen or none is. The
+    reuse distance of a sampled reference, the number of other
+    sampled keys used since the last use of its key, is scaled
+    by 1 / rate to stand for the whole trace. A reference hits
+    in an LRU cache of c items exactly when its reuse distance
+    is below c.
+
+    Only the last use of every sampled key counts, so once the
+    tree holds twice as many uses as keys, the last uses are
+    renumbered in order and the tree rebuilt: its size follows
+    the number of sampled keys, not the length of the trace.
+
+    As in SHARDS-adj, the difference between the expected
+    rate * references and the count of sampled references,
+    positive or negative, is added to the hits of the smallest
+    distance, which keeps a sample holding too many or too few
+    hot keys from skewing the curve.
+    """
+
+    MIN_COMPACT = 1024
+
+    def __init__(self, rate: float = 0.01):
+        """
+        Args:
+            rate (float): The fraction of keys to sample, 1.0 for
+              an exact curve.
+        """
+        if not 0 < rate <= 1:
+            raise ValueError("rate must be in (0, 1]")
+        self.rate = rate
+        self.threshold = int(rate * MODULUS)
+        self.last_use = {}
+        self.uses = Fenwick()
+        self.distances = {}
+        self.references = 0
+        self.sampled = 0
+
+    def sampled_key(self, key: Hashable) -> bool:
+        """Whether `key` is in the sample."""
+        return zlib.crc32(repr(key).encode()) % MODULUS < self.threshold
+
+    def access(self, key: Hashable) -> None:
+        """Account for one reference to `key`."""
+        self.references += 1
+        if not self.sampled_key(key):
+            return
+        self.sampled += 1
+
+        now = len(self.uses)
+        last = self.last_use.get(key)
+        if last is not None:
+            distance = self.uses.prefix(now) - self.uses.prefix(last + 1)
+            self.distances[distance] = self.distances.get(distance, 0) + 1
+            self.uses.add(last, -1)
+        self.uses.append(1)
+        self.last_use[key] = now
+        if len(self.uses) > max(2 * len(self.last_use), self.MIN_COMPACT):
+            self.__compact()
+
+    def __compact(self) -> None:
+        """Renumber the last uses from 0 in order and rebuild
+        the tree over them alone."""
+        keys = sorted(self.last_use, key=self.last_use.get)
+        self.last_use = {key: use for use, key in enumerate(keys)}
+        self.uses = Fenwick(len(keys))
+
+    def feed(self, trace: Iterable[Hashable]) -> None:
+        """Account for every reference of `trace`."""
+        for key in trace:
+            self.access(key)
+
+    def curve(self, sizes: Optional[List[int]] = None,
+              points: int = 20) -> List[Dict]:
+        """
+        Return the estimated miss ratio of an LRU cache of every
+        size in `sizes`, or of `points` sizes evenly spread up to
+        the largest reuse distance seen, as a list of
+        {'max_items': ..., 'miss_ratio': ...} sorted by size.
+        """
+        scale = 1 / self.rate
+        if sizes is None:
+            largest = int(max(self.distances, default=0) * scale) + 1
+            sizes = sorted({max(largest * point // points, 1)
+                            for point in range(1, points + 1)})
+
+        total = self.references * self.rate
+        adjustment = total - self.sampled
+        hits_below = sorted((distance * scale, count)
+                            for distance, count in self.distances.items())
+
+        curve = []
+        hits = adjustment
+        index = 0
+        for size in sorted(sizes):
+            while index < len(hits_below) and hits_below[index][0] < size:
+                hits += hits_below[index][1]
+                index += 1
+            miss_ratio = 1 - hits / total if total else 0.0
+            curve.append({'max_items': size,
+                          'miss_ratio': min(max(miss_ratio, 0.0), 1.0)})
+        return curve
+
+
+def lru_miss_ratios(trace: List[Hashable],
+                    sizes: List[int]) -> Dict[int, float]:
+    """Return the miss ratio of a real LRUCache of every size
+    in `sizes` replaying `trace`."""
+    benchmark = __import__('107-trace_benchmark')
+    return {size: 1 - benchmark.replay(benchmark.make_cache('lru', size),
+                                       trace) / len(trace)
+            for size in sizes}
+
+
+def main():
+    """Read the trace and print its miss-ratio curve."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('trace', nargs='?', default='-')
+    parser.add_argument('--rate', type=float, default=0.01)
+    parser.add_argument('--sizes')
+    parser.add_argument('--points', type=int, default=20)
+    parser.add_argument('--format', choices=('csv', 'json'), default='csv')
+    parser.add_argument('--check', action='store_true')
+    args = parser.parse_args()
+
+    mrc = ShardsMRC(args.rate)
+    trace = sys.stdin if args.trace == '-' else open(args.trace)
+    with trace:
+        keys = (line.strip() for line in trace if line.strip())
+        if args.check:
+            keys = list(keys)
+        mrc.feed(keys)
+
+    sizes = list(map(int, args.sizes.split(','))) if args.sizes else None
+    curve = mrc.curve(sizes, args.points)
+    if args.check:
+        actual = lru_miss_ratios(keys, [point['max_items']
+                                        for point in curve])
+        for point in curve:
+            point['lru_miss_ratio'] = actual[point['max_items']]
+
+    if args.format == 'json':
+        print(json.dumps(curve, indent=2))
+    else:
+        print(','.join(curve[0]) if curve else 'max_items,miss_ratio')
+        for point in curve:
+            print(','.join(f"{value:.6f}" if isinstance(value, float)
+                           else str(value) for value in point.values()))
+
+
+if __name__ == "__main__":
+    main()
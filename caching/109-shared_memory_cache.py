@@ -0,0 +1,321 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+import contextlib
+import fcntl
+import hashlib
+import os
+import pickle
+import struct
+import tempfile
+from multiprocessing import resource_tracker, shared_memory
+
+from base_caching import BaseCaching
+from policy_caching import DISCARD, print_removal
+FIFOCache = __import__('1-fifo_cache').FIFOCache
+LIFOCache = __import__('2-lifo_cache').LIFOCache
+LRUCache = __import__('3-lru_cache').LRUCache
+MRUCache = __import__('4-mru_cache').MRUCache
+
+MAGIC = b'SMC1'
+HEADER = struct.Struct('<4sIIIIii')
+SLOT = struct.Struct('<BiiQII')
+EMPTY = 0
+USED = 1
+NIL = -1
+
+# Whether victims are taken from the most recent end of the
+# order, and whether a get moves the key to that end.
+ORDERS = {
+    FIFOCache: (False, False),
+    LIFOCache: (True, False),
+    LRUCache: (False, True),
+    MRUCache: (True, True),
+}
+
+
+class SharedMemoryCache(BaseCaching):
+    """
+    Create a class SharedMemoryCache that inherits
+    from BaseCaching and is a caching system:
+
+    The items live in a multiprocessing.shared_memory segment
+    instead of a dict, so every process opening the segment of
+    the same `name` on a host sees the same cache.
+
+    The segment holds a fixed-slot open-addressing table of
+    twice max_items slots with linear probing. The keys are
+    linked through their slots in the order FIFOCache,
+    LIFOCache, LRUCache or MRUCache would keep them, so the
+    policy is shared along with the items. Keys and items are pickled and
+    must fit together in `slot_size` bytes; a put of a bigger
+    item is discarded. Processes are serialized by an flock on
+    a lock file next to the other temporary files, which every
+    process opens on its own, forked after the cache or not.
+    """
+
+    def __init__(self, name='atlas_cache', policy=LRUCache,
+                 max_items=None, slot_size=256):
+        """
+        Open the segment `name`, creating it if it does not exist.
+
+        Args:
+            name (str): The name of the segment shared by the processes.
+            policy (type): FIFOCache, LIFOCache, LRUCache or MRUCache.
+            max_items (int): The number of items, BaseCaching.MAX_ITEMS
+              by default. Ignored when the segment already exists.
+            slot_size (int): The bytes of a slot, key and item included.
+              Ignored when the segment already exists.
+        """
+        if policy not in ORDERS:
+            raise ValueError(f"{policy.__name__} cannot be shared")
+        self.from_recent, self.move_on_get = ORDERS[policy]
+        self.listeners = [print_removal]
+
+        self.lock_path = os.path.join(tempfile.gettempdir(), f'{name}.lock')
+        self.lock_pid = os.getpid()
+        self.lock_file = open(self.lock_path, 'a')
+        with self.__locked():
+            try:
+                self.shm = shared_memory.SharedMemory(name)
+            except FileNotFoundError:
+                max_items = max_items or self.MAX_ITEMS
+                if slot_size <= SLOT.size:
+                    raise ValueError("slot_size is too small")
+                slots = 2 * max_items
+                self.shm = shared_memory.SharedMemory(
+                    name, create=True,
+                    size=HEADER.size + slots * slot_size)
+                HEADER.pack_into(self.shm.buf, 0, MAGIC, max_items,
+                                 slots, slot_size, 0, NIL, NIL)
+            # The segment must outlive the process that created it,
+            # until unlink() is called.
+            resource_tracker.unregister(self.shm._name, 'shared_memory')
+
+        magic, self.max_items, self.slots, self.slot_size = \
+            HEADER.unpack_from(self.shm.buf, 0)[:4]
+        if magic != MAGIC:
+            raise ValueError(f"{name} is not a shared cache segment")
+
+    @property
+    def cache_data(self):
+        """A snapshot of the items of the segment."""
+        with self.__locked():
+            cache_data = {}
+            index = self.__header()[1]
+            while index != NIL:
+                key, item = self.__read(index)
+                cache_data[key] = item
+                index = self.__slot(index)[2]
+            return cache_data
+
+    def put(self, key, item):
+        """
+        Must assign the item value for the key key in the segment.
+        If key or item is None, this method should not do anything.
+        If the number of items in the segment is
+          higher that max_items:
+        you must discard the item chosen by the policy
+        you must report the key discarded to the listeners,
+          which by default print DISCARD: with it
+        """
+        if key is None or item is None:
+            return
+
+        blob = pickle.dumps(key)
+        data = pickle.dumps(item)
+        digest = self.__digest(blob)
+        removed = []
+        with self.__locked():
+            index, free = self.__find(blob, digest)
+            if len(blob) + len(data) > self.slot_size - SLOT.size:
+                if index is not None:
+                    self.__delete(index)
+                removed.append((key, item))
+            elif index is not None:
+                self.__write(index, digest, blob, data)
+                self.__move_to_end(index)
+            else:
+                count, first, last = self.__header()
+                if count >= self.max_items:
+                    victim = last if self.from_recent else first
+                    removed.append(self.__read(victim))
+                    self.__delete(victim)
+                    free = self.__find(blob, digest)[1]
+                self.__write(free, digest, blob, data)
+                self.__link(free)
+
+        for key, item in removed:
+            for listener in self.listeners:
+                listener(key, item, DISCARD)
+
+    def get(self, key):
+        """
+        Must return the value in the segment linked to key.
+        If key is None or if the key doesn’t
+        exist in the segment, return None.
+        """
+        if key is None:
+            return None
+
+        blob = pickle.dumps(key)
+        with self.__locked():
+            index = self.__find(blob, self.__digest(blob))[0]
+            if index is None:
+                return None
+            if self.move_on_get:
+                self.__move_to_end(index)
+            return self.__read(index)[1]
+
+    def close(self):
+        """Detach this process from the segment."""
+        self.shm.close()
+        self.lock_file.close()
+
+    def unlink(self):
+        """Destroy the segment, once every process closed it."""
+        resource_tracker.register(self.shm._name, 'shared_memory')
+        self.shm.unlink()
+
+    @contextlib.contextmanager
+    def __locked(self):
+        """Hold the lock shared by the processes."""
+        # An flock belongs to the open file, which a forked process
+        # shares with its parent: it needs its own to be excluded.
+        if os.getpid() != self.lock_pid:
+            self.lock_file.close()
+            self.lock_file = open(self.lock_path, 'a')
+            self.lock_pid = os.getpid()
+        fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def __digest(blob):
+        """Return a hash of a pickled key that is the same in
+        every process."""
+        return int.from_bytes(
+            hashlib.blake2b(blob, digest_size=8).digest(), 'little')
+
+    def __offset(self, index):
+        """Return the offset of slot `index` in the segment."""
+        return HEADER.size + index * self.slot_size
+
+    def __header(self):
+        """Return the count, first and last slot of the order."""
+        return HEADER.unpack_from(self.shm.buf, 0)[4:]
+
+    def __set_header(self, count, first, last):
+        """Store the count, first and last slot of the order."""
+        struct.pack_into('<Iii', self.shm.buf, HEADER.size - 12,
+                         count, first, last)
+
+    def __slot(self, index):
+        """Return the state, previous slot, next slot, digest,
+        key length and item length of slot `index`."""
+        return SLOT.unpack_from(self.shm.buf, self.__offset(index))
+
+    def __set_links(self, index, prev, next):
+        """Set the previous and next slots of slot `index`."""
+        struct.pack_into('<ii', self.shm.buf, self.__offset(index) + 1,
+                         prev, next)
+
+    def __find(self, blob, digest):
+        """
+        Return the slot of the pickled key `blob` and None, or
+        None and the empty slot ending its probe sequence.
+        """
+        index = digest % self.slots
+        while True:
+            state, _, _, slot_digest, key_length, _ = self.__slot(index)
+            if state == EMPTY:
+                return None, index
+            if slot_digest == digest and key_length == len(blob):
+                start = self.__offset(index) + SLOT.size
+                if self.shm.buf[start:start + key_length] == blob:
+                    return index, None
+            index = (index + 1) % self.slots
+
+    def __read(self, index):
+        """Return the key and item of slot `index`."""
+        _, _, _, _, key_length, item_length = self.__slot(index)
+        start = self.__offset(index) + SLOT.size
+        middle = start + key_length
+        return (pickle.loads(self.shm.buf[start:middle]),
+                pickle.loads(self.shm.buf[middle:middle + item_length]))
+
+    def __write(self, index, digest, blob, data):
+        """Store a pickled key and item in slot `index`, keeping
+        its links."""
+        _, prev, next = self.__slot(index)[:3]
+        offset = self.__offset(index)
+        SLOT.pack_into(self.shm.buf, offset, USED, prev, next,
+                       digest, len(blob), len(data))
+        start = offset + SLOT.size
+        self.shm.buf[start:start + len(blob) + len(data)] = blob + data
+
+    def __link(self, index):
+        """Add slot `index` at the most recent end of the order."""
+        count, first, last = self.__header()
+        self.__set_links(index, last, NIL)
+        if last == NIL:
+            first = index
+        else:
+            self.__set_links(last, self.__slot(last)[1], index)
+        self.__set_header(count + 1, first, index)
+
+    def __unlink(self, index):
+        """Take slot `index` out of the order."""
+        count, first, last = self.__header()
+        _, prev, next = self.__slot(index)[:3]
+        if prev == NIL:
+            first = next
+        else:
+            self.__set_links(prev, self.__slot(prev)[1], next)
+        if next == NIL:
+            last = prev
+        else:
+            self.__set_links(next, prev, self.__slot(next)[2])
+        self.__set_header(count - 1, first, last)
+
+    def __move_to_end(self, index):
+        """Make slot `index` the most recent of the order."""
+        self.__unlink(index)
+        self.__link(index)
+
+    def __delete(self, index):
+        """
+        Empty slot `index`, shifting back the keys probed after
+        it so that no probe sequence is broken, without leaving
+        tombstones behind.
+        """
+        self.__unlink(index)
+        hole = index
+        while True:
+            index = (index + 1) % self.slots
+            state, prev, next, digest = self.__slot(index)[:4]
+            if state == EMPTY:
+                break
+            home = digest % self.slots
+            if (hole < home <= index if hole <= index
+                    else home > hole or home <= index):
+                continue
+
+            source = self.__offset(index)
+            target = self.__offset(hole)
+            self.shm.buf[target:target + self.slot_size] = \
+                self.shm.buf[source:source + self.slot_size]
+            count, first, last = self.__header()
+            if prev == NIL:
+                first = hole
+            else:
+                self.__set_links(prev, self.__slot(prev)[1], hole)
+            if next == NIL:
+                last = hole
+            else:
+                self.__set_links(next, hole, self.__slot(next)[2])
+            self.__set_header(count, first, last)
+            hole = index
+
+        struct.pack_into('<B', self.shm.buf, self.__offset(hole), EMPTY)
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+from order_list import OrderList
+from policy_caching import PolicyCaching
+
+
+class ClockCache(PolicyCaching):
+    """
+    Create a class ClockCache that inherits
+    from BaseCaching and is a caching system:
+
+    If the number of items in self.cache_data is
+      higher that BaseCaching.MAX_ITEMS:
+    you must discard an item chosen by the CLOCK algorithm,
+      an approximation of LRU
+
+    The keys sit on a ring with a reference bit each. A get
+    only sets the bit of its key, so hits never reorder the
+    ring. To discard, the hand sweeps the ring from its
+    position, clearing the bits it passes, and stops at the
+    first key whose bit was already clear.
+    """
+
+    def __init__(self, max_bytes=None, weigher=None):
+        super().__init__(max_bytes, weigher)
+
+        self.ring = OrderList()
+        self.referenced = set()
+
+    def victim(self):
+        """
+        Return the key that the next put of a new key
+        would discard once the cache is full, or None
+        if the cache is empty.
+        """
+        for key in self.ring:
+            if key not in self.referenced:
+                return key
+        return self.ring.first()
+
+    def _ordered_keys(self):
+        """Return the keys from the hand around the ring."""
+        return list(self.ring)
+
+    def _key_state(self, key):
+        """The reference bit of key is saved in snapshots."""
+        return key in self.referenced
+
+    def _restore_key(self, key, state):
+        """A restored key gets back its reference bit."""
+        self.ring.append(key)
+        if state:
+            self.referenced.add(key)
+
+    def _insert(self, key):
+        """A new key goes just behind the hand, unreferenced."""
+        self.ring.append(key)
+
+    def _access(self, key):
+        """A key that is read or put again is referenced."""
+        self.referenced.add(key)
+
+    def _remove(self, key):
+        """Take key off the ring."""
+        self.ring.remove(key)
+        self.referenced.discard(key)
+
+    def _evict(self):
+        """
+        Sweep the hand, giving referenced keys a second chance,
+        and take the first unreferenced key off the ring.
+        """
+        ring = self.ring
+        referenced = self.referenced
+        while ring:
+            key = ring.first()
+            if key not in referenced:
+                ring.remove(key)
+                return key
+            referenced.remove(key)
+            ring.move_to_end(key)
+        return None
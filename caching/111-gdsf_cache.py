@@ -0,0 +1,180 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+import heapq
+import itertools
+
+from policy_caching import PolicyCaching
+
+
+class GDSFCache(PolicyCaching):
+    """
+    Create a class GDSFCache that inherits
+    from BaseCaching and is a caching system:
+
+    If the cache is full:
+    you must discard the item with the lowest priority
+      (GreedyDual-Size-Frequency algorithm)
+
+    The priority of a key is L + frequency * cost / size, where
+    L, the inflation clock, is the priority of the last item
+    discarded. Cheap, big and rarely used items go first, and
+    items that stopped being used age out as L rises past them.
+    put() takes the cost of recomputing an item, 1 by default,
+    and its size, its weight by default. Meant to be used with
+    max_bytes, to maximize the bytes and the cost saved by hits.
+
+    Priorities are kept in a heap where an entry whose priority
+    changed is left behind and skipped once it surfaces;
+    `entries` maps every key to its live heap entry.
+    """
+
+    def __init__(self, max_bytes=None, weigher=None):
+        super().__init__(max_bytes, weigher)
+
+        self.inflation = 0.0
+        self.heap = []
+        self.entries = {}
+        self.freq = {}
+        self.costs = {}
+        self.sizes = {}
+        self.hit_bytes = 0
+        self.saved_cost = 0
+        self.__counter = itertools.count()
+        self.__cost = 1
+        self.__size = None
+        self.__shift = 0.0
+
+    def put(self, key, item, ttl=None, cost=None, size=None):
+        """
+        Must assign to the dictionary self.cache_data the
+        item value for the key key.
+        If key or item is None, this method should not do anything.
+        If the cache is full:
+        you must discard the item with the lowest priority
+        you must report the key discarded to the listeners,
+          which by default print DISCARD: with it
+        If ttl is given, the item expires ttl seconds later.
+        If cost is given, it is the cost of recomputing the item.
+        If size is given, it is the size of the item, counted
+          against max_bytes instead of its weight.
+        """
+        self.__cost = 1 if cost is None else cost
+        self.__size = size
+        try:
+            super().put(key, item, ttl)
+        finally:
+            self.__cost = 1
+            self.__size = None
+
+    def stats(self):
+        """Return the statistics of PolicyCaching with the bytes
+        and the cost saved by hits."""
+        stats = super().stats()
+        stats['hit_bytes'] = self.hit_bytes
+        stats['saved_cost'] = self.saved_cost
+        return stats
+
+    def victim(self):
+        """
+        Return the key that the next put of a new key
+        would discard once the cache is full, or None
+        if the cache is empty.
+        """
+        heap = self.heap
+        while heap and self.entries.get(heap[0][2]) is not heap[0]:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def _weigh(self, item):
+        """Return the size given to put(), or else the weight
+        of `item`, always 0 without a byte budget."""
+        if self.max_bytes is None:
+            return 0
+        if self.__size is not None:
+            return self.__size
+        return self.weigher(item)
+
+    def _ordered_keys(self):
+        """Return the keys from the lowest priority."""
+        return [key for _, _, key in sorted(self.entries.values())]
+
+    def _key_state(self, key):
+        """The frequency, cost, size and priority of key are
+        saved in snapshots."""
+        return (self.freq[key], self.costs[key], self.sizes[key],
+                self.entries[key][0])
+
+    def _policy_state(self):
+        """The inflation clock is saved in snapshots."""
+        return self.inflation
+
+    def _restore_policy_state(self, state):
+        """Move the inflation clock forward to the saved one,
+        shifting the saved priorities by as much as it is ahead."""
+        self.__shift = max(self.inflation - state, 0.0)
+        self.inflation = max(self.inflation, state)
+
+    def _restore_key(self, key, state):
+        """A restored key gets back its frequency, cost, size and
+        priority."""
+        self.freq[key], self.costs[key], self.sizes[key], priority = state
+        self.__push(key, priority + self.__shift)
+
+    def _insert(self, key):
+        """A new key has been used once."""
+        self.freq[key] = 1
+        self.__set_cost(key)
+        self.__push(key)
+
+    def _update(self, key):
+        """A key put again is used once more, with its new cost
+        and size."""
+        self.freq[key] += 1
+        self.__set_cost(key)
+        self.__push(key)
+
+    def _access(self, key):
+        """A key that is read is used once more."""
+        self.freq[key] += 1
+        self.hit_bytes += self.sizes[key]
+        self.saved_cost += self.costs[key]
+        self.__push(key)
+
+    def _remove(self, key):
+        """Forget the priority of key; its heap entries go stale."""
+        del self.entries[key]
+        del self.freq[key]
+        del self.costs[key]
+        del self.sizes[key]
+
+    def _evict(self):
+        """Take the key of lowest priority out of the heap,
+        moving the inflation clock up to its priority."""
+        key = self.victim()
+        if key is not None:
+            self.inflation = heapq.heappop(self.heap)[0]
+            self._remove(key)
+        return key
+
+    def __set_cost(self, key):
+        """Record the cost and size given to put() for key."""
+        size = self.__size
+        if size is None:
+            size = self.weigher(self.cache_data[key])
+        self.costs[key] = self.__cost
+        self.sizes[key] = max(size, 1)
+
+    def __push(self, key, priority=None):
+        """Give key a new priority, computed unless given, leaving
+        its old heap entry stale, and rebuild the heap once stale
+        entries outnumber the live ones."""
+        if priority is None:
+            priority = (self.inflation +
+                        self.freq[key] * self.costs[key] / self.sizes[key])
+        entry = (priority, next(self.__counter), key)
+        self.entries[key] = entry
+        heapq.heappush(self.heap, entry)
+
+        if len(self.heap) > 2 * len(self.entries) + 64:
+            self.heap = list(self.entries.values())
+            heapq.heapify(self.heap)
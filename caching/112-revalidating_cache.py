@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from base_caching import BaseCaching
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class RevalidatingCache(BaseCaching):
+    """
+    Create a class RevalidatingCache that inherits
+    from BaseCaching and is a caching system:
+
+    A stale-while-revalidate layer over an instance of a
+    policy. get_or_load() serves an item younger than its
+    soft ttl as is. Past its soft ttl, the stale item is still
+    returned right away while a thread pool reloads it. Past
+    its hard ttl the item is gone, and the caller blocks on the
+    loader. Concurrent loads and refreshes of a key are
+    coalesced into one call of the loader. A refresh is dropped
+    if the item it replaces was put again, discarded or expired
+    while it ran.
+    """
+
+    def __init__(self, policy=LRUCache, workers=4):
+        """
+        Create an instance of `policy` and the refresh threads.
+
+        Args:
+            policy (type): The BaseCaching class storing the items.
+            workers (int): The number of threads refreshing items.
+        """
+        self.cache = policy()
+        self.lock = threading.Lock()
+        self.loading = {}
+        self.refreshing = set()
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='revalidate')
+        self.clock = time.monotonic
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @property
+    def cache_data(self):
+        """A snapshot of the items of the cache, stale or not."""
+        with self.lock:
+            return {key: box[0]
+                    for key, box in self.cache.cache_data.items()}
+
+    def put(self, key, item, soft_ttl=None, hard_ttl=None):
+        """
+        Must assign the item value for the key key.
+        If key or item is None, this method should not do anything.
+        The item is stale after soft_ttl seconds and gone after
+          hard_ttl seconds, if given.
+        """
+        if key is None or item is None:
+            return
+
+        with self.lock:
+            self.__store(key, item, soft_ttl, hard_ttl)
+
+    def get(self, key):
+        """
+        Must return the value linked to key, even if stale.
+        If key is None or if the key doesn’t
+        exist in the cache, or is past its hard ttl, return None.
+        """
+        if key is None:
+            return None
+
+        with self.lock:
+            box = self.cache.get(key)
+        return None if box is None else box[0]
+
+    def get_or_load(self, key, loader, soft_ttl=None, hard_ttl=None):
+        """
+        Return the item of `key`, calling `loader(key)` to load it
+        and caching the result with `soft_ttl` and `hard_ttl`.
+
+        A fresh item is returned as is. A stale item is returned
+        as well, and a background thread calls the loader to
+        replace it; if that fails, the stale item is kept until
+        its hard ttl. A missing item is loaded while the caller
+        waits, and errors of the loader are raised to every
+        caller waiting for that load.
+        """
+        with self.lock:
+            box = self.cache.get(key)
+            if box is not None:
+                item, fresh_until = box
+                if fresh_until is not None and fresh_until <= self.clock():
+                    self.stale_hits += 1
+                    if key not in self.refreshing and key not in self.loading:
+                        self.refreshing.add(key)
+                        self.executor.submit(self.__refresh, key, box,
+                                             loader, soft_ttl, hard_ttl)
+                return item
+
+            future = self.loading.get(key)
+            leader = future is None
+            if leader:
+                future = self.loading[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            item = loader(key)
+        except BaseException as error:
+            with self.lock:
+                del self.loading[key]
+            future.set_exception(error)
+            raise
+
+        with self.lock:
+            self.__store(key, item, soft_ttl, hard_ttl)
+            del self.loading[key]
+        future.set_result(item)
+        return item
+
+    def stats(self):
+        """Return the statistics of the cache with the number of
+        stale hits and of background refreshes, done or failed."""
+        with self.lock:
+            stats = self.cache.stats()
+            stats['stale_hits'] = self.stale_hits
+            stats['refreshes'] = self.refreshes
+            stats['refresh_errors'] = self.refresh_errors
+        return stats
+
+    def close(self):
+        """Wait for the running refreshes and stop the threads."""
+        self.executor.shutdown(wait=True)
+
+    def __store(self, key, item, soft_ttl, hard_ttl):
+        """Cache `item` with the time it goes stale, holding
+        the lock."""
+        fresh_until = None if soft_ttl is None else self.clock() + soft_ttl
+        self.cache.put(key, (item, fresh_until), hard_ttl)
+
+    def __refresh(self, key, box, loader, soft_ttl, hard_ttl):
+        """Reload the stale item of `key`, cached in `box`,
+        in a background thread."""
+        try:
+            item = loader(key)
+        except Exception:
+            with self.lock:
+                self.refresh_errors += 1
+                self.refreshing.discard(key)
+            return
+
+        with self.lock:
+            self.refreshing.discard(key)
+            # Every store makes a new box, so the box is the version
+            # of the item the refresh was started for.
+            deadline = self.cache.expiry.get(key)
+            if self.cache.cache_data.get(key) is not box or (
+                    deadline is not None and deadline <= self.cache.clock()):
+                return
+            self.__store(key, item, soft_ttl, hard_ttl)
+            self.refreshes += 1
@@ -0,0 +1,206 @@
+#!/usr/bin/python3
+""" inherits from BaseCaching and is a caching system:"""
+import pickle
+import threading
+import time
+
+import redis
+
+from base_caching import BaseCaching
+LRUCache = __import__('3-lru_cache').LRUCache
+
+INVALIDATE_CHANNEL = b'__redis__:invalidate'
+
+
+class RedisNearCache(BaseCaching):
+    """
+    Create a class RedisNearCache that inherits
+    from BaseCaching and is a caching system:
+
+    Redis holds the items shared by every node, and a small
+    instance of a policy (L1) keeps the hot ones in process,
+    so that their gets make no round trip.
+
+    L1 stays coherent through Redis client tracking in
+    broadcasting mode (Redis 6 or later): a connection owned
+    by a daemon thread asks Redis to report every write to a
+    key under `prefix`, from any client, on the
+    __redis__:invalidate channel it subscribes to, and drops
+    those keys from L1. If that connection is lost, L1 is
+    cleared, since invalidations may have been missed, and
+    the thread reconnects.
+
+    Since this node is told about its own writes too, a put
+    only drops the key from L1, and the next get brings the
+    value back in. A get that misses L1 only fills it if no
+    invalidation of its key, or of all keys, came in while it
+    read Redis.
+
+    Keys must be strings; items are pickled.
+    """
+
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, policy=LRUCache, prefix='cache:', host='localhost',
+                 port=6379, db=0):
+        """
+        Connect to Redis and start tracking the keys of the cache.
+
+        Args:
+            policy (type): The BaseCaching class of the L1.
+            prefix (str): The prefix of the Redis keys of the cache.
+            host (str): The Redis host.
+            port (int): The Redis port.
+            db (int): The Redis database.
+        """
+        self.cache = policy()
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.versions = {}
+        self.closed = False
+        self._redis = redis.Redis(host=host, port=port, db=db)
+
+        # RESP2, so that invalidations come as pub/sub messages
+        # and not as pushes whatever the default of redis-py.
+        self.tracking = redis.Connection(host=host, port=port, db=db,
+                                         socket_timeout=None, protocol=2)
+        self.__track()
+        self.thread = threading.Thread(target=self.__listen, daemon=True)
+        self.thread.start()
+
+    @property
+    def cache_data(self):
+        """The items held in memory by the L1."""
+        return self.cache.cache_data
+
+    def put(self, key, item, ttl=None):
+        """
+        Must assign the item value for the key key in Redis,
+        dropping the key from the L1.
+        If key or item is None, this method should not do anything.
+        If ttl is given, the item expires ttl seconds later.
+        """
+        if key is None or item is None:
+            return
+
+        if ttl is None:
+            self._redis.set(self.prefix + key, pickle.dumps(item))
+        else:
+            self._redis.set(self.prefix + key, pickle.dumps(item),
+                            px=max(int(ttl * 1000), 1))
+        with self.lock:
+            if key in self.cache.cache_data:
+                self.cache._remove(key)
+                self.cache._drop(key)
+
+    def get(self, key):
+        """
+        Must return the value linked to key, from the L1 or
+        else from Redis, in which case it is kept in the L1.
+        If key is None or if the key doesn’t
+        exist in Redis, return None.
+        """
+        if key is None:
+            return None
+
+        with self.lock:
+            item = self.cache.get(key)
+            if item is not None:
+                return item
+            # The version of the key is only kept while gets of it
+            # read Redis, with the number of those gets.
+            reading = self.versions.setdefault(key, [0, 0])
+            reading[1] += 1
+            version = reading[0]
+            generation = self.generation
+
+        try:
+            blob_key = self.prefix + key
+            with self._redis.pipeline(transaction=False) as pipe:
+                blob, ttl = pipe.get(blob_key).pttl(blob_key).execute()
+            item = None if blob is None else pickle.loads(blob)
+        finally:
+            with self.lock:
+                reading = self.versions[key]
+                reading[1] -= 1
+                if not reading[1]:
+                    del self.versions[key]
+                # An invalidation of the key seen since the read
+                # means the value may already be stale.
+                if (item is not None and version == reading[0] and
+                        generation == self.generation):
+                    self.cache.put(key, item,
+                                   ttl / 1000 if ttl > 0 else None)
+        return item
+
+    def close(self):
+        """Stop tracking the keys and close the connections."""
+        self.closed = True
+        try:
+            self._redis.client_kill_filter(_id=self.tracking_id)
+        except redis.RedisError:
+            pass
+        self.thread.join()
+        self.tracking.disconnect()
+        self._redis.close()
+
+    def __track(self):
+        """Connect the tracking connection, make it track the keys
+        under the prefix and subscribe it to the invalidations."""
+        connection = self.tracking
+        connection.connect()
+        connection.send_command('CLIENT', 'ID')
+        self.tracking_id = connection.read_response()
+        connection.send_command('CLIENT', 'TRACKING', 'ON',
+                                'REDIRECT', self.tracking_id,
+                                'BCAST', 'PREFIX', self.prefix)
+        connection.read_response()
+        connection.send_command('SUBSCRIBE', INVALIDATE_CHANNEL)
+        connection.read_response()
+
+    def __listen(self):
+        """Drop the invalidated keys from L1 until close()."""
+        start = len(self.prefix)
+        while not self.closed:
+            try:
+                message = self.tracking.read_response()
+            except (redis.ConnectionError, OSError):
+                self.__invalidate(None)
+                if not self.closed:
+                    self.__reconnect()
+                continue
+
+            if message[0] != b'message' or message[1] != INVALIDATE_CHANNEL:
+                continue
+            keys = message[2]
+            self.__invalidate(None if keys is None else
+                              [key[start:].decode() for key in keys])
+
+    def __invalidate(self, keys):
+        """Drop `keys` from L1, or every key if `keys` is None."""
+        with self.lock:
+            if keys is None:
+                self.generation += 1
+                for key in list(self.cache.cache_data):
+                    self.cache._remove(key)
+                    self.cache._drop(key)
+                return
+            for key in keys:
+                if key in self.versions:
+                    self.versions[key][0] += 1
+                if key in self.cache.cache_data:
+                    self.cache._remove(key)
+                    self.cache._drop(key)
+
+    def __reconnect(self):
+        """Track the keys again on a new connection, retrying
+        every RECONNECT_DELAY seconds until it works or close()."""
+        self.tracking.disconnect()
+        while not self.closed:
+            try:
+                self.__track()
+                return
+            except (redis.ConnectionError, OSError):
+                self.tracking.disconnect()
+                time.sleep(self.RECONNECT_DELAY)
@@ -2,55 +2,30 @@
 """
  inherits from BaseCaching and is a caching system:
 """
-from base_caching import BaseCaching
+from policy_caching import PolicyCaching
 
 
-class LIFOCache(BaseCaching):
+class LIFOCache(PolicyCaching):
     """
     Create a class LIFOCache that inherits from BaseCaching
     and is a caching system:
-    """
 
-    def __init__(self):
-        super().__init__()
+    If the number of items in self.cache_data is
+      higher that BaseCaching.MAX_ITEMS:
+    you must discard the last item put in cache (LIFO algorithm)
 
-        self.cache_data = {}
-        self.order = []
+    The stack is the insertion order of self.cache_data itself,
+    so keeping it costs nothing per entry.
+    """
 
-    def put(self, key, item):
+    def victim(self):
         """
-        def put(self, key, item):
-        Must assign to the dictionary self.cache_data
-        the item value for the key key.
-        If key or item is None, this method should not do anything.
-        If the number of items in self.cache_data is
-          higher that BaseCaching.MAX_ITEMS:
-        you must discard the last item put in cache (LIFO algorithm)
-        you must print DISCARD: with the key
-          discarded and following by a new line
-
+        Return the key that the next put of a new key
+        would discard once the cache is full, or None
+        if the cache is empty.
         """
-        if key is None or item is None:
-            return
-
-        if key in self.cache_data:
-            self.order.remove(key)
+        return next(reversed(self.cache_data), None)
 
-        self.cache_data[key] = item
-        self.order.append(key)
-
-        if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-            last_key = self.order.pop(-2)
-            del self.cache_data[last_key]
-            print(f'DISCARD: {last_key}')
-
-    def get(self, key):
-        """
-        def get(self, key):
-        Must return the value in self.cache_data linked to key.
-        If key is None or if the key doesn’t exist in
-          self.cache_data, return None.
-        """
-        if key is None or key not in self.cache_data:
-            return None
-        return self.cache_data[key]
+    def _update(self, key):
+        """A key put again goes back on top of the stack."""
+        self.cache_data[key] = self.cache_data.pop(key)
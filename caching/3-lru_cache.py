@@ -1,55 +1,45 @@
 #!/usr/bin/python3
 """ inherits from BaseCaching and is a caching system:"""
-from base_caching import BaseCaching
+from order_list import OrderList
+from policy_caching import PolicyCaching
 
 
-class LRUCache(BaseCaching):
+class LRUCache(PolicyCaching):
     """
     Create a class LRUCache that inherits
     from BaseCaching and is a caching system:
+
+    If the number of items in self.cache_data is
+      higher that BaseCaching.MAX_ITEMS:
+    you must discard the least recently used item (LRU algorithm)
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, max_bytes=None, weigher=None):
+        super().__init__(max_bytes, weigher)
 
-        self.cache_data = {}
-        self.order = []
+        self.order = OrderList()
 
-    def put(self, key, item):
+    def victim(self):
         """
-        Must assign to the dictionary self.cache_data the
-        item value for the key key.
-        If key or item is None, this method should not do anything.
-        If the number of items in self.cache_data is
-          higher that BaseCaching.MAX_ITEMS:
-        you must discard the least recently used item (LRU algorithm)
-        you must print DISCARD: with the key discarded and
-          following by a new line
+        Return the key that the next put of a new key
+        would discard once the cache is full, or None
+        if the cache is empty.
         """
-        if key is None or item is None:
-            return
+        return self.order.first()
 
-        if key in self.cache_data:
-            self.order.remove(key)
+    def _ordered_keys(self):
+        """Return the keys from the least recently used."""
+        return list(self.order)
 
-        self.cache_data[key] = item
+    def _insert(self, key):
+        """A new key is the most recently used."""
         self.order.append(key)
 
-        if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-            recent_use = self.order.pop(0)
-            del self.cache_data[recent_use]
-            print(f'DISCARD: {recent_use}')
-
-    def get(self, key):
-        """
-        Must return the value in self.cache_data linked to key.
-        If key is None or if the key doesn’t
-        exist in self.cache_data, return None.
-        """
-        if key is None or key not in self.cache_data:
-            return None
+    def _access(self, key):
+        """A key that is read or put again becomes
+        the most recently used."""
+        self.order.move_to_end(key)
 
+    def _remove(self, key):
+        """Forget the recency of key."""
         self.order.remove(key)
-        self.order.append(key)
-
-        return self.cache_data[key]
@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+"""
+OrderList: an ordered set of keys with O(1) append,
+move, removal and pop at both ends.
+
+It is a hash map from key to node plus a circular
+doubly linked list, and is shared by the caching
+policies to track insertion or recency order.
+"""
+
+
+class OrderNode:
+    """A single link of the list holding one key."""
+
+    __slots__ = ('key', 'prev', 'next')
+
+    def __init__(self, key=None):
+        """Create an unlinked node for `key`."""
+        self.key = key
+        self.prev = self
+        self.next = self
+
+
+class OrderList:
+    """
+    Keys ordered from the oldest (first) to the newest (last).
+
+    Every operation is O(1): the dictionary finds the node
+    of a key and the linked list lets it be unlinked or moved
+    without scanning.
+    """
+
+    def __init__(self):
+        """Create an empty list around a sentinel root node."""
+        self.__root = OrderNode()
+        self.__nodes = {}
+
+    def __len__(self):
+        """Number of keys in the list."""
+        return len(self.__nodes)
+
+    def __contains__(self, key):
+        """Whether `key` is in the list."""
+        return key in self.__nodes
+
+    def __iter__(self):
+        """Iterate over the keys from the first to the last."""
+        root = self.__root
+        node = root.next
+        while node is not root:
+            yield node.key
+            node = node.next
+
+    def __reversed__(self):
+        """Iterate over the keys from the last to the first."""
+        root = self.__root
+        node = root.prev
+        while node is not root:
+            yield node.key
+            node = node.prev
+
+    def append(self, key):
+        """
+        Add `key` as the last key.
+
+        If `key` is already in the list it is moved to the end.
+        """
+        node = self.__nodes.get(key)
+        if node is None:
+            node = self.__nodes[key] = OrderNode(key)
+        else:
+            self.__unlink(node)
+        self.__link_last(node)
+
+    def move_to_end(self, key):
+        """
+        Move an existing `key` to the end of the list.
+
+        Raises:
+            KeyError: if `key` is not in the list.
+        """
+        node = self.__nodes[key]
+        self.__unlink(node)
+        self.__link_last(node)
+
+    def remove(self, key):
+        """
+        Remove `key` from the list.
+
+        Raises:
+            KeyError: if `key` is not in the list.
+        """
+        self.__unlink(self.__nodes.pop(key))
+
+    def discard(self, key):
+        """Remove `key` from the list if it is present."""
+        node = self.__nodes.pop(key, None)
+        if node is not None:
+            self.__unlink(node)
+
+    def first(self):
+        """Return the first key, or None if the list is empty."""
+        node = self.__root.next
+        return None if node is self.__root else node.key
+
+    def last(self):
+        """Return the last key, or None if the list is empty."""
+        node = self.__root.prev
+        return None if node is self.__root else node.key
+
+    def popleft(self):
+        """
+        Remove and return the first key.
+
+        Raises:
+            KeyError: if the list is empty.
+        """
+        key = self.first()
+        if not self.__nodes:
+            raise KeyError('pop from an empty OrderList')
+        self.remove(key)
+        return key
+
+    def pop(self):
+        """
+        Remove and return the last key.
+
+        Raises:
+            KeyError: if the list is empty.
+        """
+        key = self.last()
+        if not self.__nodes:
+            raise KeyError('pop from an empty OrderList')
+        self.remove(key)
+        return key
+
+    def clear(self):
+        """Remove every key from the list."""
+        root = self.__root
+        root.prev = root.next = root
+        self.__nodes.clear()
+
+    def __link_last(self, node):
+        """Link `node` just before the root, i.e. at the end."""
+        root = self.__root
+        last = root.prev
+        node.prev = last
+        node.next = root
+        last.next = node
+        root.prev = node
+
+    @staticmethod
+    def __unlink(node):
+        """Detach `node` from its neighbours."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = node
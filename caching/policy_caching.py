@@ -0,0 +1,513 @@
+#!/usr/bin/python3
+"""
+PolicyCaching: the put and get shared by the caching
+policies, with optional per-entry expiry, an optional
+byte budget, removal listeners, statistics and snapshots.
+
+A policy only keeps its own order of the keys through
+a few hooks, and PolicyCaching decides when to call them.
+"""
+import contextlib
+import os
+import pickle
+import sys
+import threading
+import time
+
+from base_caching import BaseCaching
+from timer_wheel import TimerWheel
+
+DISCARD = 'DISCARD'
+EXPIRED = 'EXPIRED'
+COUNTERS = ('hits', 'misses', 'insertions', 'evictions', 'expirations')
+SNAPSHOT_MAGIC = b'PCS1'
+
+
+def print_removal(key, item, cause):
+    """Removal listener printing `cause`: with the key removed."""
+    print(f'{cause}: {key}')
+
+
+def merge_stats(all_stats):
+    """Add up the stats() of several caches into one dictionary."""
+    merged = dict.fromkeys(COUNTERS, 0)
+    latency = {}
+    for stats in all_stats:
+        for counter in COUNTERS:
+            merged[counter] += stats[counter]
+        for name, histogram in stats.get('latency', {}).items():
+            total = latency.setdefault(name, {})
+            for bucket, count in histogram.items():
+                total[bucket] = total.get(bucket, 0) + count
+
+    lookups = merged['hits'] + merged['misses']
+    merged['hit_ratio'] = merged['hits'] / lookups if lookups else 0.0
+    if latency:
+        merged['latency'] = {name: dict(sorted(histogram.items()))
+                             for name, histogram in latency.items()}
+    return merged
+
+
+class PolicyCaching(BaseCaching):
+    """
+    Create a class PolicyCaching that inherits
+    from BaseCaching and is a caching system:
+
+    When a new key is put in a full cache, the key chosen by
+    victim() is discarded first. An item put with a ttl
+    expires ttl seconds later: it is dropped as soon as a get
+    sees it, and expired items nobody asks for are reclaimed
+    in bulk by a timer wheel as time moves on.
+
+    Every removal is reported to the callables in `listeners`
+    as listener(key, item, cause), where cause is DISCARD for
+    an eviction and EXPIRED for an expiry; by default it is
+    printed as DISCARD: or EXPIRED: with the key. stats()
+    returns counters of hits, misses, insertions, evictions
+    and expirations. Setting `latency_sample` to N times one
+    get or put in N and adds histograms of their latencies.
+
+    Given max_bytes, the cache is bounded by the total weight
+    of its items instead of BaseCaching.MAX_ITEMS: victims are
+    discarded until the new item fits, and an item heavier than
+    the whole budget, or that still does not fit once the policy
+    has no victim left, is discarded right away.
+
+    Setting MAX_ITEMS on an instance gives it its own limit.
+
+    snapshot() saves the items, their remaining ttl and the
+    order of the policy to a file that restore() loads back
+    into a new cache, so that it starts warm.
+
+    Subclasses must implement victim() and the hooks that
+    keep their order of the keys up to date.
+    """
+
+    TIMER_TICK = 1.0
+    RESTORE_BATCH = 1024
+
+    def __init__(self, max_bytes=None, weigher=None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes (int): The byte budget, or None to bound the
+              cache by BaseCaching.MAX_ITEMS.
+            weigher (callable): Returns the weight of an item,
+              sys.getsizeof by default.
+        """
+        super().__init__()
+
+        self.max_bytes = max_bytes
+        self.weigher = weigher or sys.getsizeof
+        self.weights = {}
+        self.total_weight = 0
+        self.clock = time.monotonic
+        self.expiry = {}
+        self.timers = TimerWheel(self.TIMER_TICK, self.clock())
+        self.listeners = [print_removal]
+        self.latency_sample = 0
+        self.latency = {'get': {}, 'put': {}}
+        self.operations = 0
+        for counter in COUNTERS:
+            setattr(self, counter, 0)
+
+    def put(self, key, item, ttl=None):
+        """
+        Must assign to the dictionary self.cache_data the
+        item value for the key key.
+        If key or item is None, this method should not do anything.
+        If the number of items in self.cache_data is
+          higher that BaseCaching.MAX_ITEMS:
+        you must discard the item chosen by the policy
+        you must report the key discarded to the listeners,
+          which by default print DISCARD: with it
+        If ttl is given, the item expires ttl seconds later,
+          otherwise it never expires.
+        """
+        if self.latency_sample:
+            self._timed('put', self._put, key, item, ttl)
+        else:
+            self._put(key, item, ttl)
+
+    def get(self, key):
+        """
+        Must return the value in self.cache_data linked to key.
+        If key is None or if the key doesn’t
+        exist in self.cache_data, or has expired, return None.
+        """
+        if self.latency_sample:
+            return self._timed('get', self._get, key)
+        return self._get(key)
+
+    def put_many(self, items, ttl=None):
+        """
+        Put every key and item of `items`, a dictionary or an
+        iterable of (key, item) pairs, in order.
+
+        The cache ends up in the same state, and reports the same
+        discards, as with one put per pair, but expired items are
+        reclaimed once for the whole batch. Pairs with a None key
+        or item are skipped. If ttl is given, every item expires
+        ttl seconds later.
+        """
+        if isinstance(items, dict):
+            items = items.items()
+
+        self._reclaim()
+
+        for key, item in items:
+            if key is not None and item is not None:
+                self._store(key, item, ttl)
+
+    def get_many(self, keys):
+        """
+        Return a dictionary of the items found for `keys`,
+        looked up in order as get() would, skipping None keys
+        and the keys missing from the cache or expired.
+        """
+        self._reclaim()
+
+        found = {}
+        for key in keys:
+            if key is not None:
+                item = self._lookup(key)
+                if item is not None:
+                    found[key] = item
+        return found
+
+    def stats(self):
+        """
+        Return the counters of the cache, its hit ratio and,
+        when latencies are sampled, a histogram per operation
+        mapping a power of two of nanoseconds to the number of
+        sampled calls that took less than it.
+        """
+        stats = {counter: getattr(self, counter) for counter in COUNTERS}
+        if self.latency_sample:
+            stats['latency'] = self.latency
+        return merge_stats([stats])
+
+    def snapshot(self, path):
+        """
+        Write the items of the cache to the file `path`, in
+        the order the policy would discard them, with their
+        remaining ttl and the state the policy keeps per key,
+        such as LFU frequencies.
+
+        The file is a pickle behind a magic number, written to
+        a temporary file first so that a crash never leaves a
+        truncated snapshot behind.
+        """
+        self._reclaim()
+
+        now = self.clock()
+        entries = []
+        for key in self._ordered_keys():
+            deadline = self.expiry.get(key)
+            ttl = None if deadline is None else deadline - now
+            entries.append((key, self.cache_data[key], ttl,
+                            self._key_state(key)))
+
+        temporary = f'{path}.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC)
+            pickle.dump((time.time(), entries, self._policy_state()), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    def restore(self, path, background=False, lock=None):
+        """
+        Load the items of the snapshot file `path` into the cache.
+
+        Items already in the cache are newer than the snapshot
+        and are kept. Items that expired since the snapshot are
+        skipped, and the restore stops once the policy would
+        have to discard an item to go on. Listeners and counters
+        do not see restored items.
+
+        Args:
+            path (str): The file written by snapshot().
+            background (bool): Whether to restore in a daemon
+              thread while the cache keeps serving.
+            lock: A lock held while every RESTORE_BATCH items are
+              added, which the threads serving the cache must
+              also hold around get and put. Required when
+              background is True.
+
+        Returns:
+            The thread doing the restore when background is True,
+            otherwise None.
+        """
+        if background and lock is None:
+            raise ValueError("a background restore needs a lock")
+        if background:
+            thread = threading.Thread(target=self.restore,
+                                      args=(path, False, lock),
+                                      daemon=True)
+            thread.start()
+            return thread
+
+        with open(path, 'rb') as f:
+            if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a cache snapshot")
+            created, entries, policy_state = pickle.load(f)
+
+        with lock or contextlib.nullcontext():
+            self._restore_policy_state(policy_state)
+
+        elapsed = time.time() - created
+        for start in range(0, len(entries), self.RESTORE_BATCH):
+            with lock or contextlib.nullcontext():
+                if not self._restore_batch(
+                        entries[start:start + self.RESTORE_BATCH],
+                        elapsed):
+                    break
+        return None
+
+    def _restore_batch(self, entries, elapsed):
+        """Add the snapshot `entries` taken `elapsed` seconds ago,
+        and return False once the cache is full."""
+        for key, item, ttl, state in entries:
+            if key in self.cache_data:
+                continue
+            if ttl is not None:
+                ttl -= elapsed
+                if ttl <= 0:
+                    continue
+
+            weight = self._weigh(item)
+            if self._full(weight) and (self.max_bytes is not None or
+                                       self.victim() is not None):
+                return False
+            self.cache_data[key] = item
+            self._set_weight(key, weight)
+            self._restore_key(key, state)
+            if ttl is not None:
+                self._set_ttl(key, ttl)
+        return True
+
+    def _put(self, key, item, ttl):
+        """put() without the latency sampling."""
+        if key is None or item is None:
+            return
+
+        self._reclaim()
+        self._store(key, item, ttl)
+
+    def _store(self, key, item, ttl):
+        """Put `item` in the cache for `key`, once expired items
+        were reclaimed."""
+        weight = self._weigh(item)
+        if self.max_bytes is not None and weight > self.max_bytes:
+            self._refuse(key, item)
+            return
+
+        if key in self.cache_data:
+            self.cache_data[key] = item
+            self._set_weight(key, weight)
+            self._update(key)
+            self._shrink()
+            if key in self.cache_data and self.max_bytes is not None and (
+                    self.total_weight > self.max_bytes):
+                self._refuse(key, item)
+                return
+        else:
+            self._make_room(weight)
+            if self.max_bytes is not None and self._full(weight):
+                self._refuse(key, item)
+                return
+            self.cache_data[key] = item
+            self._set_weight(key, weight)
+            self._insert(key)
+            self.insertions += 1
+
+        if key in self.cache_data:
+            self._set_ttl(key, ttl)
+
+    def _get(self, key):
+        """get() without the latency sampling."""
+        if key is None:
+            return None
+
+        self._reclaim()
+        return self._lookup(key)
+
+    def _lookup(self, key):
+        """Return the item of `key`, once expired items were
+        reclaimed, or None if it is missing or expired."""
+        if key not in self.cache_data:
+            self.misses += 1
+            return None
+
+        deadline = self.expiry.get(key)
+        if deadline is not None and deadline <= self.clock():
+            self._expire(key)
+            self.misses += 1
+            return None
+
+        self._access(key)
+        self.hits += 1
+
+        return self.cache_data[key]
+
+    def victim(self):
+        """
+        Return the key that the next put of a new key
+        would discard once the cache is full, or None
+        if the cache is empty.
+        """
+        raise NotImplementedError("victim must be implemented")
+
+    def _full(self, weight=0):
+        """Whether a new item of `weight` needs a discard to fit."""
+        if self.max_bytes is None:
+            return len(self.cache_data) >= self.MAX_ITEMS
+        return self.total_weight + weight > self.max_bytes
+
+    def _make_room(self, weight=0):
+        """Discard victims until a new item of `weight` fits,
+        or until the policy has no victim to offer."""
+        while self.cache_data and self._full(weight):
+            key = self._evict()
+            if key is None:
+                return
+            self._discard(key)
+
+    def _shrink(self):
+        """Discard victims until the items fit the byte budget,
+        after an item was put again with a heavier value."""
+        while self.max_bytes is not None and (
+                self.total_weight > self.max_bytes):
+            key = self._evict()
+            if key is None:
+                return
+            self._discard(key)
+
+    def _ordered_keys(self):
+        """Return the cached keys in an order that _restore_key()
+        turns back into the order of the policy."""
+        return list(self.cache_data)
+
+    def _key_state(self, key):
+        """Return what the policy knows about `key` besides its
+        place in the order, to be saved in a snapshot."""
+        return None
+
+    def _policy_state(self):
+        """Return what the policy knows besides its cached keys,
+        to be saved in a snapshot."""
+        return None
+
+    def _restore_policy_state(self, state):
+        """Hook: a snapshot is being restored with the `state`
+        returned by _policy_state(), before its keys."""
+
+    def _restore_key(self, key, state):
+        """Hook: `key` was restored from a snapshot with the
+        `state` returned by _key_state(), after the keys before
+        it in _ordered_keys()."""
+        self._insert(key)
+
+    def _insert(self, key):
+        """Hook: a new `key` was put in the cache."""
+
+    def _update(self, key):
+        """Hook: the item of a cached `key` was put again."""
+        self._access(key)
+
+    def _access(self, key):
+        """Hook: a get found the item of `key`."""
+
+    def _remove(self, key):
+        """Hook: `key` left the cache and must be forgotten."""
+
+    def _evict(self):
+        """Remove the key chosen by victim() from the order
+        of the policy and return it."""
+        key = self.victim()
+        if key is not None:
+            self._remove(key)
+        return key
+
+    def _drop(self, key):
+        """Delete and return the item of `key`, which already
+        left the order of the policy."""
+        item = self.cache_data.pop(key)
+        self.total_weight -= self.weights.pop(key, 0)
+        if self.expiry.pop(key, None) is not None:
+            self.timers.cancel(key)
+        return item
+
+    def _notify(self, key, item, cause):
+        """Report the removal of `key` to every listener."""
+        for listener in self.listeners:
+            listener(key, item, cause)
+
+    def _discard(self, key):
+        """Drop the evicted `key` and report it."""
+        self.evictions += 1
+        self._notify(key, self._drop(key), DISCARD)
+
+    def _refuse(self, key, item):
+        """Discard the new `item` of `key`, which is not let in,
+        along with the old item of `key` if any."""
+        if key in self.cache_data:
+            self._remove(key)
+            self._drop(key)
+        self.evictions += 1
+        self._notify(key, item, DISCARD)
+
+    def _expire(self, key):
+        """Remove the expired `key` and report it."""
+        self._remove(key)
+        self.expirations += 1
+        self._notify(key, self._drop(key), EXPIRED)
+
+    def _timed(self, name, method, *args):
+        """Call `method`, recording its latency in the histogram
+        `name` once every `latency_sample` calls."""
+        self.operations += 1
+        if self.operations % self.latency_sample:
+            return method(*args)
+
+        start = time.perf_counter_ns()
+        result = method(*args)
+        bucket = 1 << (time.perf_counter_ns() - start).bit_length()
+        histogram = self.latency[name]
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+        return result
+
+    def _weigh(self, item):
+        """Return the weight of `item`, always 0 without
+        a byte budget."""
+        if self.max_bytes is None:
+            return 0
+        return self.weigher(item)
+
+    def _set_weight(self, key, weight):
+        """Record `weight` as the weight of the item of `key`."""
+        if self.max_bytes is None:
+            return
+        self.total_weight += weight - self.weights.get(key, 0)
+        self.weights[key] = weight
+
+    def _set_ttl(self, key, ttl):
+        """Make `key` expire `ttl` seconds from now, or never
+        if `ttl` is None."""
+        if ttl is None:
+            if self.expiry.pop(key, None) is not None:
+                self.timers.cancel(key)
+            return
+
+        deadline = self.clock() + ttl
+        self.expiry[key] = deadline
+        self.timers.schedule(key, deadline)
+
+    def _reclaim(self):
+        """Expire every key the timer wheel says is due."""
+        if not self.timers:
+            return
+
+        for key in self.timers.advance(self.clock()):
+            self._expire(key)
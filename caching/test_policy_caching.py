@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Unittests for the caching policies built on policy_caching.py"""
+
+import os
+import random
+import tempfile
+import unittest
+
+BasicCache = __import__('0-basic_cache').BasicCache
+FIFOCache = __import__('1-fifo_cache').FIFOCache
+LIFOCache = __import__('2-lifo_cache').LIFOCache
+LRUCache = __import__('3-lru_cache').LRUCache
+MRUCache = __import__('4-mru_cache').MRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+ARCCache = __import__('101-arc_cache').ARCCache
+TinyLFUCache = __import__('102-tinylfu_cache').TinyLFUCache
+TieredCache = __import__('104-tiered_cache').TieredCache
+ClockCache = __import__('110-clock_cache').ClockCache
+GDSFCache = __import__('111-gdsf_cache').GDSFCache
+
+POLICIES = (BasicCache, FIFOCache, LIFOCache, LRUCache, MRUCache,
+            LFUCache, ARCCache, ClockCache, GDSFCache)
+MAX_ITEMS = 4
+
+
+def random_ops(seed, count=200, keys=10):
+    """Return `count` random puts and gets over `keys` keys,
+    None keys and items included."""
+    rng = random.Random(seed)
+    return [(rng.choice(('put', 'get')),
+             rng.choice([None] + list(range(keys))),
+             rng.choice([None, 'a', 'b', 'c']))
+            for _ in range(count)]
+
+
+def make_cache(policy, **kwargs):
+    """Return a cache of `policy` holding MAX_ITEMS items whose
+    removals are recorded in its `removed` list."""
+    cache = policy(**kwargs)
+    cache.MAX_ITEMS = MAX_ITEMS
+    cache.removed = []
+    cache.listeners = [
+        lambda key, item, cause: cache.removed.append((key, cause))]
+    return cache
+
+
+def run(cache, ops):
+    """Apply `ops` to `cache` and return what the gets returned."""
+    results = []
+    for op, key, item in ops:
+        if op == 'put':
+            cache.put(key, item)
+        else:
+            results.append(cache.get(key))
+    return results
+
+
+def baseline(name, ops):
+    """
+    Apply `ops` to the original list-based policy `name` and
+    return the discarded keys and what the gets returned.
+    """
+    data, order, freq, used = {}, [], {}, {}
+    discarded, results = [], []
+    for step, (op, key, item) in enumerate(ops):
+        if op == 'get':
+            if key is None or key not in data:
+                results.append(None)
+                continue
+            if name in ('lru', 'mru'):
+                order.remove(key)
+                order.append(key)
+            freq[key] = freq.get(key, 0) + 1
+            used[key] = step
+            results.append(data[key])
+            continue
+
+        if key is None or item is None:
+            continue
+        if key in data:
+            order.remove(key)
+            freq[key] += 1
+        else:
+            if len(data) >= MAX_ITEMS:
+                if name in ('fifo', 'lru'):
+                    victim = order[0]
+                elif name in ('lifo', 'mru'):
+                    victim = order[-1]
+                else:
+                    victim = min(order, key=lambda k: (freq[k], used[k]))
+                order.remove(victim)
+                del data[victim], freq[victim], used[victim]
+                discarded.append(victim)
+            freq[key] = 1
+        data[key] = item
+        order.append(key)
+        used[key] = step
+    return discarded, results
+
+
+class TestDiscards(unittest.TestCase):
+    """Tests the policies against the original list-based ones."""
+
+    def test_same_discards_as_baseline(self):
+        """Test that every policy discards the keys the original
+        one did, and that gets return the same items."""
+        for name, policy in (('fifo', FIFOCache), ('lifo', LIFOCache),
+                             ('lru', LRUCache), ('mru', MRUCache),
+                             ('lfu', LFUCache)):
+            for seed in range(50):
+                with self.subTest(policy=name, seed=seed):
+                    ops = random_ops(seed)
+                    cache = make_cache(policy)
+                    results = run(cache, ops)
+                    discarded, expected = baseline(name, ops)
+                    self.assertEqual(results, expected)
+                    self.assertEqual(
+                        [key for key, _ in cache.removed], discarded)
+
+    def test_byte_budget(self):
+        """Test that no policy goes past its byte budget."""
+        for policy in POLICIES:
+            rng = random.Random(0)
+            cache = make_cache(policy, max_bytes=300, weigher=len)
+            for _ in range(500):
+                with self.subTest(policy=policy.__name__):
+                    cache.put(rng.randrange(10), 'x' * rng.randint(1, 120))
+                    self.assertLessEqual(cache.total_weight, 300)
+                    self.assertEqual(
+                        cache.total_weight,
+                        sum(map(len, cache.cache_data.values())))
+
+
+class TestBatch(unittest.TestCase):
+    """Tests put_many and get_many against loops of put and get."""
+
+    def assertSameBatches(self, make):
+        """Apply random batches with put_many and get_many to one
+        cache made by `make`, and one put or get per key to
+        another, and compare them after every batch."""
+        for seed in range(30):
+            rng = random.Random(seed)
+            batched, looped = make(), make()
+            for _ in range(40):
+                keys = [rng.choice([None] + list(range(12)))
+                        for _ in range(rng.randint(0, 8))]
+                with self.subTest(seed=seed):
+                    if rng.random() < 0.5:
+                        items = [(key, rng.choice([None, 1, 2]))
+                                 for key in keys]
+                        batched.put_many(items)
+                        for key, item in items:
+                            looped.put(key, item)
+                    else:
+                        expected = {}
+                        for key in keys:
+                            item = looped.get(key)
+                            if item is not None:
+                                expected[key] = item
+                        self.assertEqual(batched.get_many(keys), expected)
+                    self.assertEqual(list(batched.cache_data.items()),
+                                     list(looped.cache_data.items()))
+                    self.assertEqual(batched.removed, looped.removed)
+
+    def test_policies(self):
+        """Test put_many and get_many of every policy."""
+        for policy in POLICIES:
+            with self.subTest(policy=policy.__name__):
+                self.assertSameBatches(lambda: make_cache(policy))
+
+    def test_tinylfu(self):
+        """Test put_many and get_many of TinyLFUCache, sketch
+        included."""
+        def make():
+            cache = TinyLFUCache(width=32)
+            cache.cache.MAX_ITEMS = MAX_ITEMS
+            cache.removed = []
+            cache.cache.listeners = [
+                lambda key, item, cause: cache.removed.append(key)]
+            return cache
+        self.assertSameBatches(make)
+
+    def test_tiered(self):
+        """Test put_many and get_many of TieredCache, whose L2 keeps
+        every key the L1 discards."""
+        with tempfile.TemporaryDirectory() as directory:
+            paths = iter(range(1000))
+
+            def make():
+                cache = TieredCache(path=os.path.join(
+                    directory, f'{next(paths)}.db'))
+                cache.cache.MAX_ITEMS = MAX_ITEMS
+                cache.removed = []
+                cache.listeners = []
+                return cache
+            self.assertSameBatches(make)
+
+
+class TestSnapshot(unittest.TestCase):
+    """Tests that a restored cache behaves as the one snapshotted."""
+
+    def test_restore_replays(self):
+        """Test that a cache restored from a snapshot discards the
+        same keys as the original under the same operations."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'snapshot')
+            for policy in POLICIES:
+                for seed in range(20):
+                    with self.subTest(policy=policy.__name__, seed=seed):
+                        cache = make_cache(policy)
+                        run(cache, random_ops(seed))
+                        cache.snapshot(path)
+                        restored = make_cache(policy)
+                        restored.restore(path)
+                        self.assertEqual(restored.cache_data,
+                                         cache.cache_data)
+
+                        cache.removed.clear()
+                        ops = random_ops(seed + 1000)
+                        self.assertEqual(run(restored, ops), run(cache, ops))
+                        self.assertEqual(restored.removed, cache.removed)
+                        self.assertEqual(restored.cache_data,
+                                         cache.cache_data)
+
+    def test_background_restore_needs_lock(self):
+        """Test that a background restore without a lock is refused."""
+        with self.assertRaises(ValueError):
+            LRUCache().restore('snapshot', background=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Unittests for timer_wheel.py"""
+
+import random
+import unittest
+
+from timer_wheel import TimerWheel
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Tests TimerWheel against brute-force deadlines."""
+
+    def test_against_deadlines(self):
+        """Test that advance returns only keys past their deadline,
+        and leaves none more than a tick overdue."""
+        rng = random.Random(0)
+        for trial in range(20):
+            tick = rng.choice([1, 0.5, 0.01])
+            wheel = TimerWheel(tick, 0.0)
+            now = 0.0
+            deadlines = {}
+            for _ in range(2000):
+                op = rng.random()
+                key = rng.randint(0, 300)
+                if op < 0.5:
+                    deadline = now + rng.choice([
+                        rng.random() * 5, rng.random() * 500,
+                        rng.random() * 100000, rng.random() * 3e7 * tick])
+                    wheel.schedule(key, deadline)
+                    deadlines[key] = deadline
+                elif op < 0.6:
+                    wheel.cancel(key)
+                    deadlines.pop(key, None)
+                else:
+                    now += rng.choice([0.1, 1, 10, 100,
+                                       rng.random() * 1e5 * tick])
+                    with self.subTest(trial=trial, now=now):
+                        for key in wheel.advance(now):
+                            self.assertLessEqual(deadlines.pop(key),
+                                                 now + 1e-9)
+                        horizon = (now // tick) * tick - tick
+                        self.assertFalse([key for key, deadline
+                                          in deadlines.items()
+                                          if deadline <= horizon])
+                self.assertEqual(len(wheel), len(deadlines))
+
+    def test_cancel(self):
+        """Test that a cancelled key never comes back."""
+        wheel = TimerWheel(1, 0.0)
+        wheel.schedule('a', 5)
+        wheel.schedule('b', 5)
+        wheel.cancel('a')
+        self.assertNotIn('a', wheel)
+        self.assertEqual(list(wheel.advance(10)), ['b'])
+        self.assertEqual(len(wheel), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""
+TimerWheel: a hierarchical hashed timer wheel that
+tells which keys have reached their deadline.
+
+Time is cut in ticks. Level 0 has one slot per tick for
+the next 64 ticks, level 1 one slot per 64 ticks for the
+next 64 ** 2 ticks, and so on. When a level wraps around,
+the keys of its next slot cascade down to finer levels, so
+scheduling, cancelling and reclaiming a key are O(1)
+amortized and no per-key timer is ever created.
+"""
+import math
+
+
+class TimerWheel:
+    """Keys scheduled to expire at a given time."""
+
+    SLOT_BITS = 6
+    LEVELS = 4
+    SLOT_MASK = (1 << SLOT_BITS) - 1
+
+    def __init__(self, tick, now):
+        """
+        Create an empty wheel.
+
+        Args:
+            tick (float): The resolution of the wheel in seconds.
+            now (float): The current time in seconds.
+        """
+        self.tick = tick
+        self.now = math.floor(now / tick)
+        self.wheels = [{} for _ in range(self.LEVELS)]
+        self.overflow = {}
+        self.timers = {}
+
+    def __len__(self):
+        """Number of scheduled keys."""
+        return len(self.timers)
+
+    def __contains__(self, key):
+        """Whether `key` is scheduled."""
+        return key in self.timers
+
+    def schedule(self, key, deadline):
+        """
+        Schedule `key` to expire at `deadline`, in seconds,
+        replacing any previous deadline of `key`.
+        """
+        self.cancel(key)
+        when = math.ceil(deadline / self.tick)
+        self.__place(key, max(when, self.now + 1))
+
+    def cancel(self, key):
+        """Unschedule `key` if it is scheduled."""
+        slot = self.timers.pop(key, None)
+        if slot is not None:
+            del slot[key]
+
+    def advance(self, now):
+        """
+        Move the wheel to `now`, in seconds. Runs of ticks with
+        nothing to do in the finer levels are skipped at once.
+
+        Returns:
+            list: The keys whose deadline has passed, which are
+            no longer scheduled.
+        """
+        target = math.floor(now / self.tick)
+        expired = []
+        while self.now < target and self.timers:
+            shift = 0
+            for wheel in self.wheels:
+                if wheel:
+                    break
+                shift += self.SLOT_BITS
+            tick = ((self.now >> shift) + 1) << shift
+            if tick > target:
+                break
+            self.now = tick
+            self.__cascade()
+            slot = self.wheels[0].pop(self.now & self.SLOT_MASK, None)
+            if slot:
+                for key in slot:
+                    del self.timers[key]
+                expired.extend(slot)
+        if self.now < target:
+            self.now = target
+        return expired
+
+    def __cascade(self):
+        """
+        Move the keys of the slots that start at the current
+        tick down to finer levels.
+        """
+        for level in range(1, self.LEVELS):
+            shift = self.SLOT_BITS * level
+            if self.now & ((1 << shift) - 1):
+                return
+            index = (self.now >> shift) & self.SLOT_MASK
+            slot = self.wheels[level].pop(index, None)
+            if slot:
+                for key, when in slot.items():
+                    self.__place(key, when)
+
+        if not self.now & ((1 << self.SLOT_BITS * self.LEVELS) - 1):
+            overflow, self.overflow = self.overflow, {}
+            for key, when in overflow.items():
+                self.__place(key, when)
+
+    def __place(self, key, when):
+        """Put `key`, due at tick `when`, in the slot covering it."""
+        delta = when - self.now
+        for level in range(self.LEVELS):
+            shift = self.SLOT_BITS * level
+            if delta < 1 << (shift + self.SLOT_BITS):
+                index = (when >> shift) & self.SLOT_MASK
+                slot = self.wheels[level].setdefault(index, {})
+                break
+        else:
+            slot = self.overflow
+
+        slot[key] = when
+        self.timers[key] = slot
@@ -7,6 +7,10 @@ import csv
 import math
 from typing import List, Tuple
 
+from columnar_dataset import ColumnarDataset
+from lazy_dataset import LazyDataset
+from mapped_dataset import MappedDataset
+
 
 class Server:
     """
@@ -14,14 +18,31 @@ class Server:
     """
     DATA_FILE = "Popular_Baby_Names.csv"
 
-    def __init__(self):
-        """Constructor"""
+    def __init__(self, lazy: bool = False, mapped: bool = False,
+                 columnar: bool = False):
+        """Constructor, parsing DATA_FILE on demand if lazy,
+        through a memory-mapped row index if mapped, or into
+        compact columns if columnar; only one of the three modes
+        can be set"""
+        if lazy + mapped + columnar > 1:
+            raise ValueError("lazy, mapped and columnar cannot be combined")
+        self.lazy = lazy
+        self.mapped = mapped
+        self.columnar = columnar
         self.__dataset = None
 
     def dataset(self) -> List[List]:
-        """Cached dataset
+        """Cached dataset, a LazyDataset in lazy mode,
+        a MappedDataset in mapped mode and a ColumnarDataset
+        in columnar mode
         """
-        if self.__dataset is None:
+        if self.__dataset is None and self.columnar:
+            self.__dataset = ColumnarDataset(self.DATA_FILE)
+        elif self.__dataset is None and self.mapped:
+            self.__dataset = MappedDataset(self.DATA_FILE)
+        elif self.__dataset is None and self.lazy:
+            self.__dataset = LazyDataset(self.DATA_FILE)
+        elif self.__dataset is None:
             with open(self.DATA_FILE) as f:
                 reader = csv.reader(f)
                 dataset = [row for row in reader]
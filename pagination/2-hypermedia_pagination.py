@@ -7,6 +7,10 @@ import csv
 import math
 from typing import List, Tuple, Dict
 
+from columnar_dataset import ColumnarDataset
+from lazy_dataset import LazyDataset
+from mapped_dataset import MappedDataset
+
 
 class Server:
     """
@@ -14,14 +18,31 @@ class Server:
     """
     DATA_FILE = "Popular_Baby_Names.csv"
 
-    def __init__(self):
-        """Constructor"""
+    def __init__(self, lazy: bool = False, mapped: bool = False,
+                 columnar: bool = False):
+        """Constructor, parsing DATA_FILE on demand if lazy,
+        through a memory-mapped row index if mapped, or into
+        compact columns if columnar; only one of the three modes
+        can be set"""
+        if lazy + mapped + columnar > 1:
+            raise ValueError("lazy, mapped and columnar cannot be combined")
+        self.lazy = lazy
+        self.mapped = mapped
+        self.columnar = columnar
         self.__dataset = None
 
     def dataset(self) -> List[List]:
-        """Cached dataset
+        """Cached dataset, a LazyDataset in lazy mode,
+        a MappedDataset in mapped mode and a ColumnarDataset
+        in columnar mode
         """
-        if self.__dataset is None:
+        if self.__dataset is None and self.columnar:
+            self.__dataset = ColumnarDataset(self.DATA_FILE)
+        elif self.__dataset is None and self.mapped:
+            self.__dataset = MappedDataset(self.DATA_FILE)
+        elif self.__dataset is None and self.lazy:
+            self.__dataset = LazyDataset(self.DATA_FILE)
+        elif self.__dataset is None:
             with open(self.DATA_FILE) as f:
                 reader = csv.reader(f)
                 dataset = [row for row in reader]
@@ -52,13 +73,27 @@ class Server:
         """get_hyper method that takes the same arguments (and defaults)
         as get_page and returns a dictionary containing the
         following key-value pairs
+
+        In lazy mode, total_pages is None until the whole file
+        has been parsed, and next_page is found by parsing the
+        file up to the end of the next page at most, which gives
+        the same next_page as page < total_pages.
         """
-        total_pages = len(self.dataset()) // page_size
+        data = self.get_page(page, page_size)
+        dataset = self.dataset()
+        if getattr(dataset, 'complete', True):
+            has_next = page < len(dataset) // page_size
+        else:
+            next_end = self.index_range(page + 1, page_size)[1]
+            has_next = dataset.available(next_end) == next_end
+        total_pages = None
+        if getattr(dataset, 'complete', True):
+            total_pages = len(dataset) // page_size
         return {
             'page_size': page_size,
             'page': page,
-            'data': self.get_page(page, page_size),
-            'next_page': page + 1 if page < total_pages else None,
+            'data': data,
+            'next_page': page + 1 if has_next else None,
             'prev_page': page - 1 if page > 1 else None,
             'total_pages': total_pages
         }
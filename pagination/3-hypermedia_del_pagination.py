@@ -7,20 +7,43 @@ import csv
 import math
 from typing import List, Dict  # Import the Dict type
 
+from columnar_dataset import ColumnarDataset
+from indexed_dataset import IndexedDataset
+from lazy_dataset import LazyDataset
+from mapped_dataset import MappedDataset
+
 
 class Server:
     """Server class to paginate a database of popular baby names.
     """
     DATA_FILE = "Popular_Baby_Names.csv"
 
-    def __init__(self):
+    def __init__(self, lazy: bool = False, mapped: bool = False,
+                 columnar: bool = False):
+        """Constructor, parsing DATA_FILE on demand if lazy,
+        through a memory-mapped row index if mapped, or into
+        compact columns if columnar; only one of the three modes
+        can be set"""
+        if lazy + mapped + columnar > 1:
+            raise ValueError("lazy, mapped and columnar cannot be combined")
+        self.lazy = lazy
+        self.mapped = mapped
+        self.columnar = columnar
         self.__dataset = None
         self.__indexed_dataset = None
 
     def dataset(self) -> List[List]:
-        """Cached dataset
+        """Cached dataset, a LazyDataset in lazy mode,
+        a MappedDataset in mapped mode and a ColumnarDataset
+        in columnar mode
         """
-        if self.__dataset is None:
+        if self.__dataset is None and self.columnar:
+            self.__dataset = ColumnarDataset(self.DATA_FILE)
+        elif self.__dataset is None and self.mapped:
+            self.__dataset = MappedDataset(self.DATA_FILE)
+        elif self.__dataset is None and self.lazy:
+            self.__dataset = LazyDataset(self.DATA_FILE)
+        elif self.__dataset is None:
             with open(self.DATA_FILE) as f:
                 reader = csv.reader(f)
                 dataset = [row for row in reader]
@@ -28,15 +51,12 @@ class Server:
 
         return self.__dataset
 
-    def indexed_dataset(self) -> Dict[int, List]:
-        """Dataset indexed by sorting position, starting at 0
+    def indexed_dataset(self) -> IndexedDataset:
+        """Dataset indexed by sorting position, starting at 0,
+        whose rows can be deleted without shifting the others
         """
         if self.__indexed_dataset is None:
-            dataset = self.dataset()
-            truncated_dataset = dataset[:1000]
-            self.__indexed_dataset = {
-                i: dataset[i] for i in range(len(dataset))
-            }
+            self.__indexed_dataset = IndexedDataset(self.dataset())
         return self.__indexed_dataset
 
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
@@ -44,7 +64,7 @@ class Server:
         assert (
             index is None or
             (isinstance(index, int)
-             and 0 <= index < len(self.__indexed_dataset))
+             and 0 <= index < self.__indexed_dataset.available(index + 1))
         ), "Invalid index."
         assert (
             isinstance(page_size, int)
@@ -52,8 +72,8 @@ class Server:
 
         if index is None:
             index = 0
-        next_index = min(index + page_size, len(self.__indexed_dataset))
-        data = [self.__indexed_dataset[i] for i in range(index, next_index)]
+        rows, next_index = self.__indexed_dataset.live_rows(index, page_size)
+        data = [self.__indexed_dataset[i] for i in rows]
 
         return {
             'index': index,
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+ColumnarDataset: the rows of a CSV file, stored column by
+column in compact arrays.
+"""
+import csv
+import itertools
+from array import array
+from typing import List, Union
+
+
+class ColumnarDataset:
+    """
+    The rows of a CSV file, without its header, read like a list.
+
+    Every column is kept in an array instead of a string per row:
+    a column whose values all are integers, written the way str()
+    writes them, is an array of integers, and any other column is
+    dictionary-encoded, as an array of codes into the list of its
+    distinct values. Rows are only turned back into lists of
+    strings when they are read. Every row must have as many
+    fields as the header.
+    """
+
+    INT_TYPECODE = 'q'
+    CODE_TYPECODE = 'I'
+    CHUNK_ROWS = 65536
+
+    def __init__(self, path: str):
+        """Load the CSV file `path` into columns."""
+        self.__count = 0
+
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            self.columns = [array(self.INT_TYPECODE) for _ in header]
+            self.values = [None] * len(header)
+            encoders = [None] * len(header)
+            while True:
+                rows = list(itertools.islice(reader, self.CHUNK_ROWS))
+                if not rows:
+                    break
+                for row in rows:
+                    self.__count += 1
+                    if len(row) != len(header):
+                        raise ValueError(
+                            f"row {self.__count} has {len(row)} fields, "
+                            f"not {len(header)}")
+                for column, cells in enumerate(zip(*rows)):
+                    if encoders[column] is None and self.__add_numbers(
+                            column, cells):
+                        continue
+                    if encoders[column] is None:
+                        encoders[column] = self.__encode(column)
+                    self.__add_codes(column, cells, encoders[column])
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.__count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[List, List[List]]:
+        """Return the row at `index`, or the rows of a slice,
+        as lists of strings."""
+        if isinstance(index, slice):
+            cells = [self.__column(column, index)
+                     for column in range(len(self.columns))]
+            return [list(row) for row in zip(*cells)]
+
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("dataset index out of range")
+        return [values[codes[index]] if values is not None
+                else str(codes[index])
+                for codes, values in zip(self.columns, self.values)]
+
+    def available(self, count: int) -> int:
+        """Return `count`, or the number of rows if it is lower."""
+        return min(count, self.__count)
+
+    def __column(self, column: int, index: slice) -> List[str]:
+        """Return the strings of `column` for the rows of a slice."""
+        codes = self.columns[column][index]
+        values = self.values[column]
+        if values is None:
+            return list(map(str, codes))
+        return [values[code] for code in codes]
+
+    def __add_numbers(self, column: int, cells: tuple) -> bool:
+        """Append `cells` to the integer `column` and return True,
+        unless one of them is not an integer written by str()."""
+        try:
+            numbers = list(map(int, cells))
+            if list(map(str, numbers)) != list(cells):
+                return False
+            self.columns[column].extend(numbers)
+        except (ValueError, OverflowError):
+            return False
+        return True
+
+    def __add_codes(self, column: int, cells: tuple, encoder: dict) -> None:
+        """Append the codes of `cells` to the encoded `column`,
+        giving new values the next codes."""
+        values = self.values[column]
+        codes = array(self.CODE_TYPECODE)
+        append = codes.append
+        for value in cells:
+            code = encoder.get(value)
+            if code is None:
+                code = encoder[value] = len(values)
+                values.append(value)
+            append(code)
+        self.columns[column].extend(codes)
+
+    def __encode(self, column: int) -> dict:
+        """Switch `column` from integers to codes into its distinct
+        values, and return the map of a value to its code."""
+        encoder = {}
+        values = self.values[column] = []
+        codes = array(self.CODE_TYPECODE)
+        for number in self.columns[column]:
+            value = str(number)
+            code = encoder.get(value)
+            if code is None:
+                code = encoder[value] = len(values)
+                values.append(value)
+            codes.append(code)
+        self.columns[column] = codes
+        return encoder
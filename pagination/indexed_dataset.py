@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+IndexedDataset: the rows of a dataset by their position,
+surviving deletions through tombstones and a Fenwick tree.
+"""
+from array import array
+from typing import List, Optional, Tuple
+
+
+class IndexedDataset:
+    """
+    The rows of a dataset by their original position, read and
+    deleted like a dict of position to row.
+
+    The rows are never copied: deleting one only sets its bit in
+    a tombstone bitmap and takes it out of a Fenwick tree of the
+    live rows, in O(log n). The tree finds the k-th live row in
+    O(log n), so the next live rows after a position are found
+    without walking through the deleted ones.
+
+    A dataset with an available() method, such as a LazyDataset,
+    is only indexed as far as the rows asked for.
+    """
+
+    def __init__(self, dataset):
+        """Index the rows of `dataset`, all of them live."""
+        self.dataset = dataset
+        self.tree = array('q', [0])
+        self.tombstones = bytearray()
+        self.rows = 0
+        self.live = 0
+        if not hasattr(dataset, 'available'):
+            self.__grow(len(dataset))
+
+    def __len__(self) -> int:
+        """Return the number of live rows."""
+        self.__grow(None)
+        return self.live
+
+    def __contains__(self, index: int) -> bool:
+        """Whether the row at `index` exists and is live."""
+        return (isinstance(index, int) and 0 <= index and
+                index < self.available(index + 1) and
+                not self.__deleted(index))
+
+    def __getitem__(self, index: int) -> List:
+        """Return the live row at `index`, or raise KeyError."""
+        if index not in self:
+            raise KeyError(index)
+        return self.dataset[index]
+
+    def __delitem__(self, index: int) -> None:
+        """Delete the live row at `index`, or raise KeyError."""
+        if index not in self:
+            raise KeyError(index)
+        self.tombstones[index >> 3] |= 1 << (index & 7)
+        self.live -= 1
+        position = index + 1
+        while position <= self.rows:
+            self.tree[position] -= 1
+            position += position & -position
+
+    def available(self, count: int) -> int:
+        """Return `count`, or the number of rows, deleted or not,
+        if it is lower, indexing no more rows than needed."""
+        self.__grow(count)
+        return min(count, self.rows)
+
+    def live_rows(self, index: int, count: int) -> Tuple[List[int], int]:
+        """
+        Return the positions of the first `count` live rows at or
+        after `index`, and the position after the last of them,
+        or the number of rows if there are fewer.
+        """
+        positions = []
+        position = index
+        while len(positions) < count:
+            if position >= self.rows:
+                self.__grow(position + count - len(positions))
+                if position >= self.rows:
+                    break
+            if self.__deleted(position):
+                position = self.__next_live(position)
+                continue
+            positions.append(position)
+            position += 1
+        return positions, position
+
+    def __deleted(self, index: int) -> bool:
+        """Whether the row at `index`, already indexed, is deleted."""
+        return bool(self.tombstones[index >> 3] >> (index & 7) & 1)
+
+    def __prefix(self, end: int) -> int:
+        """Return the number of live rows before `end`."""
+        total = 0
+        while end > 0:
+            total += self.tree[end]
+            end -= end & -end
+        return total
+
+    def __next_live(self, index: int) -> int:
+        """Return the position of the first live row after the
+        deleted `index`, or the number of indexed rows if none."""
+        rank = self.__prefix(index)
+        if rank == self.live:
+            return self.rows
+
+        position = 0
+        step = 1 << (self.rows.bit_length() - 1)
+        while step:
+            if position + step <= self.rows and \
+                    self.tree[position + step] <= rank:
+                position += step
+                rank -= self.tree[position]
+            step >>= 1
+        return position
+
+    def __grow(self, count: Optional[int]) -> None:
+        """Index the rows up to `count`, or all of them if None."""
+        dataset = self.dataset
+        if count is None:
+            count = len(dataset)
+        elif hasattr(dataset, 'available'):
+            count = dataset.available(count)
+        else:
+            count = min(count, len(dataset))
+        if count <= self.rows:
+            return
+
+        start = self.rows + 1
+        if self.live == self.rows:
+            self.tree.extend(position & -position
+                             for position in range(start, count + 1))
+        else:
+            for position in range(start, count + 1):
+                low = position - (position & -position)
+                self.tree.append(1 + self.__prefix(position - 1) -
+                                 self.__prefix(low))
+        self.tombstones.extend(bytes((count + 7) // 8 -
+                                     len(self.tombstones)))
+        self.live += count - self.rows
+        self.rows = count
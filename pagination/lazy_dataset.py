@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+LazyDataset: the rows of a CSV file, parsed only as far
+as they are asked for.
+"""
+import csv
+from typing import List, Union
+
+
+class LazyDataset:
+    """
+    The rows of a CSV file, without its header, read like a list.
+
+    Rows are parsed on demand, up to the last one asked for, and
+    kept for later requests, so that the first page of a big file
+    is served without reading the rest of it. len() parses the
+    whole file.
+    """
+
+    def __init__(self, path: str):
+        """Remember the file, which is only opened on demand."""
+        self.path = path
+        self.rows = []
+        self.complete = False
+        self.__file = None
+        self.__reader = None
+
+    def __len__(self) -> int:
+        """Return the number of rows, parsing the whole file."""
+        self.__load(None)
+        return len(self.rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[List, List[List]]:
+        """Return the row at `index`, or the rows of a slice, parsing
+        the file up to them."""
+        if isinstance(index, slice):
+            stop = index.stop
+            if (stop is None or stop < 0 or
+                    (index.start is not None and index.start < 0)):
+                self.__load(None)
+            else:
+                self.__load(stop)
+        elif index < 0:
+            self.__load(None)
+        else:
+            self.__load(index + 1)
+        return self.rows[index]
+
+    def available(self, count: int) -> int:
+        """Return `count`, or the number of rows if it is lower,
+        parsing no more rows than needed to tell."""
+        self.__load(count)
+        return min(count, len(self.rows))
+
+    def __load(self, count: Union[int, None]) -> None:
+        """Parse rows until there are `count` of them, or until
+        the end of the file if `count` is None."""
+        if self.complete or (count is not None and count <= len(self.rows)):
+            return
+
+        if self.__reader is None:
+            self.__file = open(self.path, newline='')
+            self.__reader = csv.reader(self.__file)
+            next(self.__reader, None)
+
+        rows = self.rows
+        for row in self.__reader:
+            rows.append(row)
+            if count is not None and len(rows) >= count:
+                return
+
+        self.complete = True
+        self.__file.close()
+        self.__file = self.__reader = None
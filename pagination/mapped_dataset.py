@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+MappedDataset: the rows of a CSV file, read through mmap
+with a persisted index of the offset of every row.
+"""
+import csv
+import io
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import List, Union
+
+MAGIC = b'CSVIDX01'
+HEADER = struct.Struct('<8sQqQ')
+OFFSET = struct.Struct('<Q')
+
+
+class MappedDataset:
+    """
+    The rows of a CSV file, without its header, read like a list.
+
+    The byte offset where every row starts is stored in an index
+    file next to the CSV file, `path` + '.idx', built on first use
+    and rebuilt whenever the size or the modification time of the
+    CSV file changes. Both files are mapped in memory, so that a
+    slice of rows is parsed straight from the bytes between two
+    offsets: any page costs the same time and memory, whatever
+    the size of the file.
+    """
+
+    def __init__(self, path: str, index_path: str = None):
+        """Open, building it if needed, the index of the file
+        `path`, stored in `index_path`, `path` + '.idx' by default."""
+        self.path = path
+        self.index_path = index_path or path + '.idx'
+        self.__stat = None
+        self.__data = None
+        self.__index = None
+        self.__count = 0
+        self.__open()
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        self.__check()
+        return self.__count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[List, List[List]]:
+        """Return the row at `index`, or the rows of a slice,
+        parsing only them."""
+        self.__check()
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__count)
+            if step != 1:
+                return self[start:stop][::step]
+            if start >= stop:
+                return []
+            return self.__parse(start, stop)
+
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("dataset index out of range")
+        return self.__parse(index, index + 1)[0]
+
+    def available(self, count: int) -> int:
+        """Return `count`, or the number of rows if it is lower."""
+        return min(count, len(self))
+
+    def close(self) -> None:
+        """Unmap both files."""
+        for mapping in (self.__data, self.__index):
+            if isinstance(mapping, mmap.mmap):
+                mapping.close()
+        self.__data = self.__index = None
+
+    def __offset(self, row: int) -> int:
+        """Return the offset where `row` starts, or where the last
+        row ends if `row` is the number of rows."""
+        return OFFSET.unpack_from(self.__index,
+                                  HEADER.size + row * OFFSET.size)[0]
+
+    def __parse(self, start: int, stop: int) -> List[List]:
+        """Parse the rows from `start` to `stop`, excluded."""
+        text = self.__data[self.__offset(start):self.__offset(stop)].decode()
+        return list(csv.reader(io.StringIO(text, newline='')))
+
+    def __check(self) -> None:
+        """Reopen the files if the CSV file changed since."""
+        stat = os.stat(self.path)
+        if (stat.st_size, stat.st_mtime_ns) != self.__stat:
+            self.close()
+            self.__open()
+
+    def __open(self) -> None:
+        """Map the CSV file and its index, rebuilding the index
+        if it is missing or out of date."""
+        stat = os.stat(self.path)
+        self.__stat = (stat.st_size, stat.st_mtime_ns)
+        if not self.__index_matches():
+            self.__build()
+
+        with open(self.index_path, 'rb') as f:
+            self.__index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__count = HEADER.unpack_from(self.__index)[3]
+        if self.__stat[0]:
+            with open(self.path, 'rb') as f:
+                self.__data = mmap.mmap(f.fileno(), 0,
+                                        access=mmap.ACCESS_READ)
+        else:
+            self.__data = b''
+
+    def __index_matches(self) -> bool:
+        """Whether the index file was built for the CSV file as
+        it is now."""
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(HEADER.size)
+        except OSError:
+            return False
+        if len(header) != HEADER.size:
+            return False
+        magic, size, mtime_ns, _ = HEADER.unpack(header)
+        return magic == MAGIC and (size, mtime_ns) == self.__stat
+
+    def __build(self) -> None:
+        """
+        Write the offset of every row after the header, and the
+        offset of the end of the last row, to the index file.
+
+        A line ending inside a quoted field does not end its row:
+        a row goes on while it holds an odd number of quotes.
+        """
+        offsets = array('Q')
+        with open(self.path, 'rb') as f:
+            position = 0
+            quoted = False
+            header = True
+            for line in f:
+                if not quoted and not header:
+                    offsets.append(position)
+                position += len(line)
+                if line.count(b'"') % 2:
+                    quoted = not quoted
+                if not quoted:
+                    header = False
+        count = len(offsets)
+        offsets.append(position)
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+
+        temporary = self.index_path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, *self.__stat, count))
+            offsets.tofile(f)
+        os.replace(temporary, self.index_path)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Unittests for the dataset modes of the pagination Servers"""
+
+import csv
+import os
+import random
+import tempfile
+import unittest
+
+simple = __import__('1-simple_pagination')
+hypermedia = __import__('2-hypermedia_pagination')
+deletion = __import__('3-hypermedia_del_pagination')
+
+MODES = ({'lazy': True}, {'mapped': True}, {'columnar': True})
+
+
+def hyper_index(indexed, rows, index, page_size):
+    """The original get_hyper_index, walking a dict of rows."""
+    data = []
+    next_index = index
+    while len(data) < page_size and next_index < rows:
+        if next_index in indexed:
+            data.append(indexed[next_index])
+        next_index += 1
+    return {'index': index, 'next_index': next_index,
+            'page_size': page_size, 'data': data}
+
+
+class TestModes(unittest.TestCase):
+    """Tests that every dataset mode serves what the eager one does."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Write a CSV file with quoted fields spanning lines."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'names.csv')
+        rng = random.Random(0)
+        with open(cls.path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['year', 'name', 'count'])
+            for row in range(97):
+                name = rng.choice(['Ava', 'Liam', 'Mia "M"', 'Zoe\nAnn'])
+                writer.writerow([2010 + row % 7, name, rng.randint(0, 500)])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the CSV file and its index."""
+        cls.directory.cleanup()
+
+    def servers(self, module):
+        """Return an eager Server of `module` and one per mode,
+        all reading the CSV file."""
+        servers = [({}, module.Server())]
+        servers += [(mode, module.Server(**mode)) for mode in MODES]
+        for _, server in servers:
+            server.DATA_FILE = self.path
+        return servers[0][1], servers[1:]
+
+    def test_get_page(self):
+        """Test that every page of every mode is the eager one."""
+        eager, servers = self.servers(simple)
+        for mode, server in servers:
+            for page_size in range(1, 30):
+                for page in range(1, 100 // page_size + 3):
+                    with self.subTest(mode=mode, page=page, size=page_size):
+                        self.assertEqual(server.get_page(page, page_size),
+                                         eager.get_page(page, page_size))
+
+    def test_get_hyper(self):
+        """Test that every mode gives the eager pages and links,
+        total_pages aside before a lazy file is parsed."""
+        for page_size in list(range(1, 30)) + [96, 97, 98]:
+            eager, servers = self.servers(hypermedia)
+            for mode, server in servers:
+                for page in range(1, 100 // page_size + 3):
+                    with self.subTest(mode=mode, page=page, size=page_size):
+                        expected = eager.get_hyper(page, page_size)
+                        result = server.get_hyper(page, page_size)
+                        if result['total_pages'] is None:
+                            del expected['total_pages']
+                            del result['total_pages']
+                        self.assertEqual(result, expected)
+
+    def test_combined_modes(self):
+        """Test that two modes cannot be set at once."""
+        for module in (simple, hypermedia, deletion):
+            for mode in ({'lazy': True, 'mapped': True},
+                         {'lazy': True, 'columnar': True},
+                         {'mapped': True, 'columnar': True}):
+                with self.subTest(module=module.__name__, mode=mode):
+                    with self.assertRaises(ValueError):
+                        module.Server(**mode)
+
+    def test_get_hyper_index(self):
+        """Test that deleting rows gives the pages the original
+        dict-based index did, in every mode."""
+        for seed in range(10):
+            eager, servers = self.servers(deletion)
+            rows = eager.dataset()
+            for mode, server in [({}, eager)] + servers:
+                rng = random.Random(seed)
+                indexed = dict(enumerate(rows))
+                deleted = server.indexed_dataset()
+                for _ in range(150):
+                    index = rng.randrange(len(rows))
+                    with self.subTest(mode=mode, seed=seed):
+                        if rng.random() < 0.4:
+                            if index in indexed:
+                                del indexed[index]
+                                del deleted[index]
+                            else:
+                                with self.assertRaises(KeyError):
+                                    del deleted[index]
+                        else:
+                            page_size = rng.randint(1, 15)
+                            self.assertEqual(
+                                server.get_hyper_index(index, page_size),
+                                hyper_index(indexed, len(rows),
+                                            index, page_size))
+                        self.assertEqual(len(deleted), len(indexed))
+                with self.assertRaises(AssertionError):
+                    server.get_hyper_index(len(rows), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()